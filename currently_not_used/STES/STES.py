@@ -19,8 +19,133 @@ import os
 import numpy as np
 import matplotlib.pyplot as plt
 import pandas as pd
+from matplotlib.colors import Normalize
 from matplotlib.widgets import Slider, Button
 from matplotlib.animation import FuncAnimation
+from mpl_toolkits.mplot3d.art3d import Poly3DCollection
+from numba import njit
+
+@njit(cache=True, fastmath=True)
+def _simulate_stratified_kernel(T_layers, T_sto, Q_in, Q_out, Q_sto, Q_loss, Q_loss_layers_buf, rho, cp, T_ref, T_min, T_max, volume,
+                                num_layers, layer_volume, layer_thickness, thermal_conductivity, S_side, hours, loss_coeffs):
+    """
+    Numba kernel of the hourly stratified storage simulation.
+
+    T_layers (hours x num_layers) must be initialised with the initial temperature, T_sto, Q_sto, Q_loss and Q_loss_layers_buf are filled in place.
+    loss_coeffs (num_layers x 2) holds per layer the heat transfer coefficient K * S in kW/K and the ambient/soil temperature in °C.
+    """
+    heat_stored_per_layer = np.zeros(num_layers)  # Wärme in jeder Schicht
+
+    # Zeitinvariante Umrechnungsfaktoren: Wärmekapazität der Schichten in kWh/K, deren Kehrwert und Wärmeleitung zwischen den Schichten in kWh/K
+    C_kWh_per_K = np.empty(num_layers)
+    C_K_per_kWh = np.empty(num_layers)
+    for i in range(num_layers):
+        C_kWh_per_K[i] = layer_volume[i] * rho * cp / 3.6e6
+        C_K_per_kWh[i] = 1.0 / C_kWh_per_K[i]
+    C_cond = thermal_conductivity * S_side / layer_thickness * 3600 / 3.6e6
+
+    # Initiale Wärmeverluste und gespeicherte Wärme in kWh (1 kWh = 3.6e6 J)
+    Q_loss_total = 0.0
+    for i in range(num_layers):
+        Q_loss_layers_buf[i] = loss_coeffs[i, 0] * (T_layers[0, i] - loss_coeffs[i, 1])
+        Q_loss_total += Q_loss_layers_buf[i]
+    Q_loss[0] = Q_loss_total
+    Q_sto[0] = volume * rho * cp * (T_layers[0, 0] - T_ref) / 3.6e6
+    for i in range(num_layers):
+        heat_stored_per_layer[i] = Q_sto[0] / num_layers  # Anfangsgleichverteilung der Wärme
+
+    for t in range(1, hours):
+        remaining_heat = Q_in[t] - Q_out[t]  # Verfügbare Wärme, nach Abzug des Outputs
+        heat_transfer_prev = 0.0  # Wärmeleitung aus der darüberliegenden Schicht (Temperaturen des Vorzeitschritts)
+        Q_loss_total = 0.0
+        Q_sto_total = 0.0
+        T_total = 0.0
+
+        # Ein Durchlauf über alle Schichten. Die Temperaturen ergeben sich erst aus der Be-/Entladung,
+        # Verluste und Wärmeleitung des Vorzeitschritts wirken nur auf den Wärmeinhalt der Schichten.
+        for i in range(num_layers):
+            # 1. **Wärmeverluste nach außen (basierend auf den Schichttemperaturen des Vorzeitschritts)**
+            Q_loss_layers_buf[i] = loss_coeffs[i, 0] * (T_layers[t - 1, i] - loss_coeffs[i, 1])
+            Q_loss_total += Q_loss_layers_buf[i]
+            heat_stored_per_layer[i] -= Q_loss_layers_buf[i] / 3600
+
+            # 2. **Wärmeleitung zwischen den Schichten (Temperaturen des Vorzeitschritts)**
+            heat_stored_per_layer[i] += heat_transfer_prev
+            if i < num_layers - 1:
+                heat_transfer_prev = C_cond * (T_layers[t - 1, i] - T_layers[t - 1, i + 1])  # kWh pro Stunde
+                heat_stored_per_layer[i] -= heat_transfer_prev
+
+            # 3. **Entladen, wenn remaining_heat negativ ist, sonst Beladen der Schicht**
+            if remaining_heat < 0:
+                available_heat_in_layer = (T_layers[t - 1, i] - T_min) * C_kWh_per_K[i]
+                heat_needed = -remaining_heat
+
+                if heat_needed >= available_heat_in_layer:
+                    heat_stored_per_layer[i] -= available_heat_in_layer
+                    remaining_heat += available_heat_in_layer
+                else:
+                    heat_stored_per_layer[i] -= heat_needed
+                    remaining_heat = 0.0
+                T_layers[t, i] = T_layers[t - 1, i]
+
+            elif remaining_heat > 0:
+                max_heat_in_layer = (T_max - T_layers[t - 1, i]) * C_kWh_per_K[i]
+
+                if remaining_heat >= max_heat_in_layer:
+                    heat_stored_per_layer[i] += max_heat_in_layer
+                    T_layers[t, i] = T_max
+                    remaining_heat -= max_heat_in_layer
+                else:
+                    heat_stored_per_layer[i] += remaining_heat
+                    T_layers[t, i] = T_layers[t - 1, i] + remaining_heat * C_K_per_kWh[i]
+                    remaining_heat = 0.0
+            else:
+                T_layers[t, i] = T_layers[t - 1, i]
+
+            T_layers[t, i] = max(T_min, T_layers[t, i])
+
+            # 4. **Wärmetransport zur darüberliegenden Schicht, sobald beide Schichten bilanziert sind**
+            if i > 0:
+                heat_transfer_kWh = C_cond * (T_layers[t, i - 1] - T_layers[t, i])  # kWh pro Stunde
+
+                heat_stored_per_layer[i - 1] -= heat_transfer_kWh
+                heat_stored_per_layer[i] += heat_transfer_kWh
+
+                T_layers[t, i - 1] = heat_stored_per_layer[i - 1] * C_K_per_kWh[i - 1] + T_ref
+                T_layers[t, i] = heat_stored_per_layer[i] * C_K_per_kWh[i] + T_ref
+                Q_sto_total += heat_stored_per_layer[i - 1]
+                T_total += T_layers[t, i - 1]
+
+        Q_loss[t] = Q_loss_total
+        Q_sto[t] = Q_sto_total + heat_stored_per_layer[num_layers - 1]  # Gespeicherte Wärme in kWh
+        T_sto[t] = (T_total + T_layers[t, num_layers - 1]) / num_layers  # Hauptspeichertemperatur als Durchschnittstemperatur der Schichten
+
+@njit(cache=True, fastmath=True)
+def _simulate_kernel(Q_in, Q_out, Q_sto, T_sto, Q_loss, K, S, T_loss_ref, rho, cp, T_ref, volume, T_max, T_min, hours):
+    """
+    Numba kernel of the hourly simulation of the fully mixed storage, fills Q_sto, T_sto and Q_loss in place.
+    K * S is the time-invariant heat transfer coefficient in W/K against T_loss_ref (ambient or soil temperature).
+    """
+    C_kWh_per_K = volume * rho * cp / 3.6e6  # Heat capacity of the storage in kWh/K
+    C_K_per_kWh = 1.0 / C_kWh_per_K
+
+    for t in range(hours):
+        # Calculate heat loss based on the last temperature (initial temperature in the first hour)
+        T_prev = T_sto[t-1] if t > 0 else T_sto[0]
+        Q_loss[t] = (T_prev - T_loss_ref) * K * S * 1e-3  # Convert to kW
+
+        if t == 0:
+            # Convert initial stored heat calculation to kWh (1 kWh = 3.6e6 J)
+            Q_sto[t] = C_kWh_per_K * (T_sto[t] - T_ref)  # Initial stored heat in kWh
+        else:
+            # Energy balance: Use kWh (3600 seconds in 1 hour)
+            Q_sto[t] = Q_sto[t-1] + (Q_in[t] - Q_out[t] - Q_loss[t])  # Stored heat in kWh (input/output in kW)
+
+            # Update storage temperature based on kWh stored
+            T_sto[t] = Q_sto[t] * C_K_per_kWh + T_ref  # Convert back to temperature in °C
+
+        # Limit temperature within max and min bounds
+        T_sto[t] = min(T_max, max(T_min, T_sto[t]))
 
 # Globals for animation control
 is_animating = False
@@ -32,20 +157,21 @@ def update_plot(val, storage, ax):
     """Update the 3D plot based on the selected time step from the slider."""
     global current_frame
     current_frame = int(val)  # Set the current frame to the slider value
-    ax.cla()  # Clear the axis
-    storage.plot_3d_temperature_distribution(ax, current_frame)  # Plot for the given time step
+    storage._update_artists(ax, current_frame)  # Recolor the layers on this axes for the given time step
     ax.set_title(f'Temperature Stratification (Time Step {current_frame})')
     plt.draw()  # Redraw the figure
 
 def animate(i, storage, ax):
     """Animation function to update the plot at each time step."""
     global current_frame
-    ax.cla()  # Clear the axis
-    storage.plot_3d_temperature_distribution(ax, i)  # Plot for the given time step
+    collection = storage._update_artists(ax, i)  # Recolor the layers on this axes for the given time step
     ax.set_title(f'Temperature Stratification (Time Step {i})')
     current_frame = i
-    slider.set_val(i)  # Update slider position to reflect the current time step
-    return ax,
+    # Update slider position to reflect the current time step without triggering update_plot a second time
+    slider.eventson = False
+    slider.set_val(i)
+    slider.eventson = True
+    return collection,
 
 def start_animation(storage, ax):
     """Start the animation."""
@@ -126,6 +252,55 @@ def interactive_plot(storage):
     speed_slider = Slider(ax_speed, 'Speed (ms)', 50, 1000, valinit=anim_speed)
     speed_slider.on_changed(lambda val: adjust_speed(val, storage))
 
+def interactive_plot_gpu(storage):
+    """
+    OpenGL variant of interactive_plot based on VisPy (optional dependency, only imported here).
+    The mesh is uploaded once, each frame only the face colors are updated.
+    Keys: Space start/stop, Right/Left one time step forward/backward.
+    """
+    from vispy import app, scene
+
+    # Quads der Schichten in je zwei Dreiecke zerlegen
+    if storage._plot_vertices is None:
+        storage._plot_vertices = storage.calculate_plot_vertices()
+    num_layers, quads_per_layer = storage._plot_vertices.shape[:2]
+    vertices = storage._plot_vertices.reshape(-1, 3).astype(np.float32)
+    quad_starts = np.arange(num_layers * quads_per_layer)[:, None] * 4
+    faces = np.concatenate((quad_starts + [0, 1, 2], quad_starts + [0, 2, 3]), axis=1).reshape(-1, 3).astype(np.uint32)
+    face_colors = np.empty((num_layers, 2 * quads_per_layer, 4), dtype=np.float32)
+
+    canvas = scene.SceneCanvas(keys='interactive', show=True, size=(800, 800))
+    view = canvas.central_widget.add_view()
+    view.camera = 'turntable'
+    mesh = scene.visuals.Mesh(vertices=vertices, faces=faces, parent=view.scene)
+
+    state = {'frame': current_frame}
+
+    def show_frame(frame):
+        state['frame'] = frame
+        face_colors[:] = storage._layer_colors(frame)[:, None, :]
+        mesh.mesh_data.set_face_colors(face_colors.reshape(-1, 4))
+        mesh.mesh_data_changed()
+        canvas.title = f'Temperature Stratification (Time Step {frame})'
+
+    timer = app.Timer(interval=anim_speed / 1000, connect=lambda event: show_frame((state['frame'] + 1) % storage.hours))
+
+    @canvas.events.key_press.connect
+    def on_key(event):
+        if event.key == 'Space':
+            if timer.running:
+                timer.stop()
+            else:
+                timer.start()
+        elif event.key == 'Right':
+            show_frame(min(state['frame'] + 1, storage.hours - 1))
+        elif event.key == 'Left':
+            show_frame(max(state['frame'] - 1, 0))
+
+    show_frame(state['frame'])
+    view.camera.set_range()
+    app.run()
+
 class ThermalStorage:
     def __init__(self, storage_type, dimensions, rho, cp, T_ref, lambda_top, lambda_side, lambda_bottom, lambda_soil, 
                  T_amb, T_soil, T_max, T_min, initial_temp, dt_top, ds_side, db_bottom, hours=8760, num_layers=5, thermal_conductivity=0.6):
@@ -163,9 +338,39 @@ class ThermalStorage:
         else:
             raise ValueError("Unsupported storage type")
 
+        self._precompute_loss_coefficients()
+
         self.colorbar_exists = False  # Track if the color bar has already been added
         self.labels_exist = False  # Track if the labels have been set
 
+    def _precompute_loss_coefficients(self):
+        """Time-invariant heat transfer coefficients in W/m²K of the storage envelope, shared by all storage models."""
+        self._K_t = self.lambda_top / self.dt_top  # Deckel gegen Umgebung
+
+        if self.storage_type == "cylindrical_overground":
+            self._K_s = self.lambda_side / self.ds_side
+            self._K_b = (self.db_bottom / self.lambda_bottom + 4 * self.dimensions[0] / (3 * np.pi * self.lambda_soil))**(-1)
+
+        elif self.storage_type == "cylindrical_underground":
+            # Seiten und Boden zusammengefasst gegen Erdreich
+            R = self.dimensions[0]
+            H = self.dimensions[1]
+            d_min = (self.lambda_side / self.lambda_soil) * R * 0.37
+            if self.ds_side > 2 * d_min:
+                self._K_sb = (self.ds_side / self.lambda_side + 0.52 * R / self.lambda_soil)**(-1)
+            else:
+                raise ValueError("Insulation thickness too small compared to minimum required thickness.")
+            self._S_c = np.pi * R**2 + 2 * np.pi * R * H
+
+        elif self.storage_type == "truncated_cone" or self.storage_type == "truncated_trapezoid":
+            H = self.dimensions[2]
+            a = self.ds_side / self.lambda_side + np.pi * H / (2 * self.lambda_soil)
+            b = np.pi / self.lambda_soil
+            self._K_s = (1 / (b * H)) * np.log((a + b * H) / a)
+
+            c = self.db_bottom / self.lambda_bottom + np.pi * H / (2 * self.lambda_soil)
+            self._K_b = (1 / (2 * b * self.dimensions[1])) * np.log((c + b * self.dimensions[1]) / c)
+
     def calculate_cylindrical_geometry(self, dimensions):
         """Calculate surface areas and volume for cylindrical storage."""
         radius, height = dimensions
@@ -230,68 +435,39 @@ class ThermalStorage:
 class SimpleThermalStorage(ThermalStorage):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)  # Call the parent class constructor
+        self._K_loss, self._S_loss, self._T_loss_ref = self.calculate_heat_loss_coefficients()  # Time-invariant loss coefficients
 
-    def calculate_heat_loss(self, T_sto_last):
+    def calculate_heat_loss_coefficients(self):
+        """Return the area-weighted heat transfer coefficient in W/m²K, the loss surface in m² and the reference temperature in °C."""
         if self.storage_type == "cylindrical_overground":
-            # Loss from top
-            Q_t = (T_sto_last - self.T_amb) * (self.lambda_top / self.dt_top) * self.S_top
-            # Loss from sides
-            Q_s = (T_sto_last - self.T_amb) * (self.lambda_side / self.ds_side) * self.S_side
-            # Loss from bottom
-            Q_b = (T_sto_last - self.T_amb) * (self.db_bottom / self.lambda_bottom + 4 * self.dimensions[0] / (3 * np.pi * self.lambda_soil))**(-1) * self.S_bottom
-            return (Q_t + Q_s + Q_b) / 1000  # Convert to kW
+            # Top, sides and bottom against ambient temperature
+            UA = self._K_t * self.S_top + self._K_s * self.S_side + self._K_b * self.S_bottom
+            S = self.S_top + self.S_side + self.S_bottom
+            return UA / S, S, self.T_amb
 
         elif self.storage_type == "cylindrical_underground":
-            # Loss from sides and bottom combined
-            R = self.dimensions[0]
-            H = self.dimensions[1]
-            d_min = (self.lambda_side / self.lambda_soil) * R * 0.37
-            if self.ds_side > 2 * d_min:
-                K_sb = (self.ds_side / self.lambda_side + 0.52 * R / self.lambda_soil)**(-1)
-            else:
-                raise ValueError("Insulation thickness too small compared to minimum required thickness.")
-            S_c = np.pi * R**2 + 2 * np.pi * R * H
-            Q_sb = (T_sto_last - self.T_soil) * K_sb * S_c
-            return Q_sb / 1000  # Convert to kW
+            # Sides and bottom combined against soil temperature
+            return self._K_sb, self._S_c, self.T_soil
 
         elif self.storage_type == "truncated_cone" or self.storage_type == "truncated_trapezoid":
-            # Loss from sides
-            H = self.dimensions[2]
-            a = self.ds_side / self.lambda_side + np.pi * H / (2 * self.lambda_soil)
-            b = np.pi / self.lambda_soil
-            K_s = (1 / (b * H)) * np.log((a + b * H) / a)
-            Q_s = (T_sto_last - self.T_soil) * K_s * self.S_side
+            # Sides and bottom against soil temperature
+            S = self.S_side + self.S_bottom
+            return (self._K_s * self.S_side + self._K_b * self.S_bottom) / S, S, self.T_soil
 
-            # Loss from bottom
-            c = self.db_bottom / self.lambda_bottom + np.pi * H / (2 * self.lambda_soil)
-            K_b = (1 / (2 * b * self.dimensions[1])) * np.log((c + b * self.dimensions[1]) / c)
-            Q_b = (T_sto_last - self.T_soil) * K_b * self.S_bottom
-            return (Q_s + Q_b) / 1000  # Convert to kW
+        else:
+            raise ValueError("Unsupported storage type for heat loss calculation")
+
+    def calculate_heat_loss(self, T_sto_last):
+        """Heat loss in kW at the given storage temperature, using the coefficients from calculate_heat_loss_coefficients."""
+        return (T_sto_last - self._T_loss_ref) * self._K_loss * self._S_loss / 1000  # Convert to kW
 
     def simulate(self, Q_in, Q_out):
         self.Q_in = Q_in
         self.Q_out = Q_out
 
-        for t in range(0, self.hours):
-            # Calculate heat loss based on the last temperature
-            self.Q_loss[t] = self.calculate_heat_loss(self.T_sto[t-1])
-
-            if t == 0:
-                # Convert initial stored heat calculation to kWh (1 kWh = 3.6e6 J)
-                self.Q_sto[t] = self.volume * self.rho * self.cp * (self.T_sto[t] - self.T_ref) / 3.6e6  # Initial stored heat in kWh
-
-            else:
-                # Energy balance: Use kWh (3600 seconds in 1 hour)
-                self.Q_sto[t] = self.Q_sto[t-1] + (Q_in[t] - Q_out[t] - self.Q_loss[t])  # Stored heat in kWh (input/output in kW)
-
-                # Update storage temperature based on kWh stored
-                self.T_sto[t] = (self.Q_sto[t] * 3.6e6) / (self.volume * self.rho * self.cp) + self.T_ref  # Convert back to temperature in °C
-
-            # Limit temperature within max and min bounds
-            if self.T_sto[t] > self.T_max:
-                self.T_sto[t] = self.T_max
-            elif self.T_sto[t] < self.T_min:
-                self.T_sto[t] = self.T_min
+        _simulate_kernel(np.asarray(Q_in, dtype=np.float64), np.asarray(Q_out, dtype=np.float64), self.Q_sto, self.T_sto, self.Q_loss,
+                         float(self._K_loss), float(self._S_loss), float(self._T_loss_ref), float(self.rho), float(self.cp),
+                         float(self.T_ref), float(self.volume), float(self.T_max), float(self.T_min), self.hours)
         
         self.calculate_efficiency(Q_in)
 
@@ -339,6 +515,10 @@ class StratifiedThermalStorage(ThermalStorage):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.calculate_layer_thickness()  # Berechne die Schichtdicke basierend auf der Speicherdimension
+        self.calculate_layer_loss_coefficients()  # Zeitinvariante Verlustkoeffizienten der Schichten
+        self._layer_UA = self._layer_K * self._layer_S * 1e-3  # Wärmedurchgang je Schicht in kW/K
+        self._precompute_plot_geometry()  # Geometrie für die 3D-Darstellung einmalig berechnen
+        self._results_figure = None  # Figure von plot_results, wird bei weiteren Aufrufen wiederverwendet
 
     def calculate_layer_thickness(self):
         """Calculate the thickness and volume of each layer based on the storage geometry."""
@@ -387,313 +567,187 @@ class StratifiedThermalStorage(ThermalStorage):
         else:
             raise ValueError("Unsupported storage type for layer thickness calculation")
 
+    def calculate_layer_loss_coefficients(self):
+        """
+        Set the time-invariant heat loss coefficients of each layer: heat transfer coefficient _layer_K in W/m²K,
+        loss surface _layer_S in m² and reference temperature _layer_Tref (ambient or soil) in °C.
+        """
+        self._layer_K = np.zeros(self.num_layers)  # Schichten ohne Verlustansatz behalten 0 W/m²K
+        self._layer_S = np.zeros(self.num_layers)
+        self._layer_Tref = np.full(self.num_layers, float(self.T_amb))
+
+        if self.storage_type == "cylindrical_overground":
+            # Seitenschichten
+            self._layer_K[1:-1] = self._K_s
+            self._layer_S[1:-1] = self.S_side / self.num_layers
+            # Untere Schicht
+            self._layer_K[-1] = self._K_b
+            self._layer_S[-1] = self.S_bottom
+
+        elif self.storage_type == "cylindrical_underground":
+            # Seitenschichten und Boden
+            self._layer_K[1:] = self._K_sb
+            self._layer_S[1:] = self._S_c / self.num_layers
+            self._layer_Tref[1:] = self.T_soil
+
+        elif self.storage_type == "truncated_cone" or self.storage_type == "truncated_trapezoid":
+            # Seitenschichten
+            self._layer_K[1:-1] = self._K_s
+            self._layer_S[1:-1] = self.S_side / self.num_layers
+            # Untere Schicht
+            self._layer_K[-1] = self._K_b
+            self._layer_S[-1] = self.S_bottom
+            self._layer_Tref[1:] = self.T_soil
+
+        else:
+            raise ValueError("Unsupported storage type for heat loss calculation")
+
+        # Obere Schicht
+        self._layer_K[0] = self._K_t
+        self._layer_S[0] = self.S_top
+        self._layer_Tref[0] = self.T_amb
+
     def calculate_stratified_heat_loss(self, T_sto_layers):
         """
         Calculate heat loss for each layer in a stratified storage system based on geometry.
         """
-        self.Q_loss_layers = np.zeros(len(T_sto_layers))  # Wärmeverlust in kW für jede Schicht
-
-        for i, T_layer in enumerate(T_sto_layers):
-            if self.storage_type == "cylindrical_overground":
-                # Verluste für einen zylindrischen überirdischen Speicher
-                if i == 0:  # Obere Schicht
-                    Q_loss_top = (self.lambda_top / self.dt_top) * self.S_top * (T_layer - self.T_amb) / 1000
-                    self.Q_loss_layers[i] = Q_loss_top
-                elif i == len(T_sto_layers) - 1:  # Untere Schicht
-                    Q_loss_bottom = (self.db_bottom / self.lambda_bottom + 4 * self.dimensions[0] / (3 * np.pi * self.lambda_soil))**(-1) * self.S_bottom * (T_layer - self.T_amb) / 1000
-                    self.Q_loss_layers[i] = Q_loss_bottom
-                else:  # Seitenschichten
-                    Q_loss_side = (self.lambda_side / self.ds_side) * (T_layer - self.T_amb) * self.S_side / len(T_sto_layers) / 1000
-                    self.Q_loss_layers[i] = Q_loss_side
-
-            elif self.storage_type == "cylindrical_underground":
-                # Verluste für einen unterirdischen zylindrischen Speicher
-                R = self.dimensions[0]
-                H = self.dimensions[1]
-                d_min = (self.lambda_side / self.lambda_soil) * R * 0.37
-                if self.ds_side > 2 * d_min:
-                    K_sb = (self.ds_side / self.lambda_side + 0.52 * R / self.lambda_soil)**(-1)
-                else:
-                    raise ValueError("Insulation thickness too small compared to minimum required thickness.")
-                S_c = np.pi * R**2 + 2 * np.pi * R * H
-
-                if i == 0:  # Obere Schicht
-                    Q_loss_top = (self.lambda_top / self.dt_top) * self.S_top * (T_layer - self.T_amb) / 1000
-                    self.Q_loss_layers[i] = Q_loss_top
-                else:  # Seitenschichten und Boden
-                    Q_loss_sb = K_sb * S_c * (T_layer - self.T_soil) / len(T_sto_layers) / 1000
-                    self.Q_loss_layers[i] = Q_loss_sb
-
-            elif self.storage_type == "truncated_cone" or self.storage_type == "truncated_trapezoid":
-                # Verluste für PTES-Speicher (konisch und trapezförmig)
-                H = self.dimensions[2]
-                a = self.ds_side / self.lambda_side + np.pi * H / (2 * self.lambda_soil)
-                b = np.pi / self.lambda_soil
-                K_s = (1 / (b * H)) * np.log((a + b * H) / a)
-
-                c = self.db_bottom / self.lambda_bottom + np.pi * H / (2 * self.lambda_soil)
-                K_b = (1 / (2 * b * self.dimensions[1])) * np.log((c + b * self.dimensions[1]) / c)
-
-                if i == 0:  # Obere Schicht
-                    Q_loss_top = (self.lambda_top / self.dt_top) * self.S_top * (T_layer - self.T_amb) / 1000
-                    self.Q_loss_layers[i] = Q_loss_top
-                elif i == len(T_sto_layers) - 1:  # Untere Schicht
-                    Q_loss_bottom = K_b * self.S_bottom * (T_layer - self.T_soil) / 1000
-                    self.Q_loss_layers[i] = Q_loss_bottom
-                else:  # Seitenschichten
-                    Q_loss_side = K_s * self.S_side * (T_layer - self.T_soil) / len(T_sto_layers) / 1000
-                    self.Q_loss_layers[i] = Q_loss_side
-
-        return np.sum(self.Q_loss_layers)  # Gesamtverlust in kW
-
-    def simulate_stratified(self, Q_in, Q_out):
+        self.Q_loss_layers = (T_sto_layers - self._layer_Tref) * self._layer_UA  # Wärmeverlust in kW für jede Schicht
+        return self.Q_loss_layers.sum()  # Gesamtverlust in kW
+
+    def simulate_stratified(self, Q_in, Q_out, history_file=None):
         """
         Q_in: Eingangsleistung in kW
         Q_out: Ausgangsleistung in kW
         thermal_conductivity: Wärmeleitfähigkeit des Mediums (in W/m*K, z.B. für Wasser 0.6)
+        history_file: Optionaler Dateipfad, die Schichttemperaturen (hours x num_layers) werden dann als np.memmap
+                      auf die Festplatte geschrieben statt im Arbeitsspeicher gehalten (lange Zeitreihen, viele Schichten)
         """
         self.Q_in = Q_in
         self.Q_out = Q_out
         
-        self.T_sto_layers = np.full((self.hours, self.num_layers), self.T_sto[0])  # Initialisiere Schichttemperaturen
-        heat_stored_per_layer = np.zeros(self.num_layers)  # Wärme in jeder Schicht
+        if history_file is None:
+            self.T_sto_layers = np.full((self.hours, self.num_layers), self.T_sto[0])  # Initialisiere Schichttemperaturen
+        else:
+            self.T_sto_layers = np.memmap(history_file, dtype=np.float64, mode='w+', shape=(self.hours, self.num_layers))
+            self.T_sto_layers[:] = self.T_sto[0]
+        self.Q_loss_layers = np.zeros(self.num_layers)  # Wärmeverlust in kW für jede Schicht
 
-        for t in range(0, self.hours):
-            ### Berchnung der Wärmeverluste und Wärmeleitung zwischen den Schichten ###
-            # 1.1 **Berechnung der Wärmeverluste nach außen (basierend auf Schichttemperaturen)**
-            self.Q_loss[t] = self.calculate_stratified_heat_loss(self.T_sto_layers[t-1])
-            
-            if t == 0:
-                # Initiale gespeicherte Wärme in kWh (1 kWh = 3.6e6 J)
-                self.Q_sto[t] = self.volume * self.rho * self.cp * (self.T_sto[t] - self.T_ref) / 3.6e6
-                heat_stored_per_layer[:] = self.Q_sto[t] / self.num_layers  # Anfangsgleichverteilung der Wärme
+        _simulate_stratified_kernel(np.asarray(self.T_sto_layers), self.T_sto, np.asarray(Q_in, dtype=np.float64), np.asarray(Q_out, dtype=np.float64),
+                                    self.Q_sto, self.Q_loss, self.Q_loss_layers, float(self.rho), float(self.cp), float(self.T_ref),
+                                    float(self.T_min), float(self.T_max), float(self.volume), self.num_layers,
+                                    np.asarray(self.layer_volume, dtype=np.float64), float(self.layer_thickness),
+                                    float(self.thermal_conductivity), float(self.S_side), self.hours,
+                                    np.column_stack((self._layer_UA, self._layer_Tref)))
+
+        if history_file is not None:
+            self.T_sto_layers.flush()
 
+        self.calculate_efficiency(Q_in)
+        
+    def _precompute_plot_geometry(self):
+        """Cache the coordinate grids of the 3D plot, they only depend on the dimensions and the number of layers."""
+        self._z_layers = np.linspace(0, self.dimensions[-1], self.num_layers + 1)  # Höhenkoordinaten für die Schichtenübergänge
+        self._plot_vertices = None  # Quads of the storage body, built on first plot
+        self._plot_collections = {}  # Poly3DCollection of the storage body per axes, reused while the axes stay the same
+        self._sm = plt.cm.ScalarMappable(norm=Normalize(self.T_min, self.T_max), cmap=plt.cm.coolwarm)  # Shared by layer colors and color bar
+        self._cmap_lut = self._sm.cmap(np.arange(self._sm.cmap.N))  # RGBA lookup table of the colormap
+
+        if self.storage_type == "cylindrical" or self.storage_type == "truncated_cone":
+            self._theta = np.linspace(0, 2 * np.pi, 50)  # Winkelkoordinaten für den Zylinder
+            self._cos_theta = np.cos(self._theta)
+            self._sin_theta = np.sin(self._theta)
+
+            if self.storage_type == "cylindrical":
+                self._radii = np.full(self.num_layers + 1, self.dimensions[0])
             else:
-                # 1.2 **Berechnung der Wärmeverluste nach außen (basierend auf Schichttemperaturen)**
-                for i in range(self.num_layers):
-                    # Berechne den Wärmeverlust für die Schicht
-                    Q_loss_layer = self.Q_loss_layers[i]  # Wärmeverlust in kWh
+                top_radius, bottom_radius, height = self.dimensions
+                self._radii = np.linspace(bottom_radius, top_radius, self.num_layers + 1)  # Radius for each z-layer based on the linear slope
 
-                    # Ziehe Wärmeverluste von der gespeicherten Wärme in der Schicht ab
-                    heat_stored_per_layer[i] -= Q_loss_layer / 3600  # Wärmeverlust in kWh
+        elif self.storage_type == "truncated_trapezoid":
+            # Swap top and bottom dimensions to ensure the narrow end is at the bottom
+            bottom_length, bottom_width, top_length, top_width, height = self.dimensions
+            self._lengths = np.linspace(bottom_length, top_length, self.num_layers + 1)
+            self._widths = np.linspace(bottom_width, top_width, self.num_layers + 1)
 
-                    # Berechne die Temperaturänderung aufgrund des Wärmeverlustes
-                    # delta_T = Q_loss_layer / (m * cp), wobei m = rho * volume der Schicht
-                    delta_T = (Q_loss_layer * 3.6e6) / (self.layer_volume * self.rho * self.cp)  # in °C
+    def calculate_plot_vertices(self):
+        """
+        Quads of the storage body for the 3D plot, ordered by layer from bottom to top.
+        Returns an array of shape (num_layers, quads_per_layer, 4, 3).
+        """
+        num_layers = self.num_layers
+        z_layers = self._z_layers
 
-                    # Aktualisiere die Temperatur der Schicht basierend auf der Temperaturänderung
-                    self.T_sto_layers[t, i] = self.T_sto_layers[t - 1, i] - delta_T  # Temperaturverlust
+        if self.storage_type == "cylindrical" or self.storage_type == "truncated_cone":
+            radii = self._radii
+            cos_t, sin_t = self._cos_theta, self._sin_theta
+            shape = (num_layers, len(self._theta) - 1)
 
-                # 2. **Berechnung der Wärmeleitung innerhalb des Speichers (zwischen den Schichten)**
-                for i in range(self.num_layers - 1):
-                    delta_T = self.T_sto_layers[t - 1, i] - self.T_sto_layers[t - 1, i + 1]
-                    heat_transfer = self.thermal_conductivity * self.S_side * delta_T / self.layer_thickness  # W = J/s
-                    heat_transfer_kWh = heat_transfer / 3.6e6 * 3600  # kWh pro Stunde
+            def ring(r, z, start, stop):
+                """Points on the circle with radius r at height z for the angular segments start..stop, shape (num_layers, segments, 3)."""
+                return np.stack([r[:, None] * cos_t[start:stop], r[:, None] * sin_t[start:stop], np.broadcast_to(z[:, None], shape)], axis=-1)
 
-                    # Wärme von Schicht i abziehen und zur Schicht i+1 hinzufügen
-                    heat_stored_per_layer[i] -= heat_transfer_kWh
-                    heat_stored_per_layer[i + 1] += heat_transfer_kWh
+            bottom_0, bottom_1 = ring(radii[:-1], z_layers[:-1], 0, -1), ring(radii[:-1], z_layers[:-1], 1, None)
+            top_0, top_1 = ring(radii[1:], z_layers[1:], 0, -1), ring(radii[1:], z_layers[1:], 1, None)
+            bottom_center, top_center = ring(np.zeros(num_layers), z_layers[:-1], 0, -1), ring(np.zeros(num_layers), z_layers[1:], 0, -1)
 
-                    # Aktualisiere die Temperaturen basierend auf dem neuen Wärmeinhalt
-                    delta_T_transfer = heat_transfer_kWh * 3.6e6 / (self.layer_volume * self.rho * self.cp)  # in °C
-
-                    # Temperaturanpassung für die beiden benachbarten Schichten
-                    self.T_sto_layers[t, i] -= delta_T_transfer  # Schicht i verliert Wärme
-                    self.T_sto_layers[t, i + 1] += delta_T_transfer  # Schicht i+1 gewinnt Wärme
-
-                ### Berechne die verfügbare Wärme im Zeitschritt (Bilanz Input - Output) ###
-                remaining_heat = self.Q_in[t] - self.Q_out[t]  # Verfügbare Wärme, nach Abzug des Outputs
-
-                # **Entlade Schichten, wenn remaining_heat negativ ist (Wärmebedarf höher als Input)**
-                for i in range(self.num_layers):  # Entlade von unten nach oben
-                    if remaining_heat < 0:
-                        # Wärmebedarf ist höher als die Eingangsleistung, Speicher entlädt
-                        available_heat_in_layer = (self.T_sto_layers[t-1, i] - self.T_min) * self.layer_volume * self.rho * self.cp / 3.6e6  # verfügbare Wärme in kWh
-                        heat_needed = abs(remaining_heat)
-
-                        if heat_needed >= available_heat_in_layer:
-                            # Schicht wird komplett entladen
-                            heat_stored_per_layer[i] -= available_heat_in_layer
-                            self.T_sto_layers[t, i] = self.T_min  # Temperatur erreicht die minimale Grenze
-                            remaining_heat += available_heat_in_layer  # Entlade die verfügbare Wärme
-                        else:
-                            # Schicht wird nur teilweise entladen
-                            heat_stored_per_layer[i] -= heat_needed
-                            self.T_sto_layers[t, i] = self.T_sto_layers[t-1, i] - (heat_needed * 3.6e6) / (self.layer_volume * self.rho * self.cp)
-                            remaining_heat = 0  # Wärmebedarf gedeckt, keine weitere Entladung erforderlich
-
-                # **Lade Schichten, wenn remaining_heat positiv ist (Input höher als Wärmebedarf)**
-                for i in range(self.num_layers):  # Belade von oben nach unten
-                    # Berechne die maximal mögliche Wärme, um die Schicht auf T_max zu bringen
-                    max_heat_in_layer = (self.T_max - self.T_sto_layers[t-1, i]) * self.layer_volume * self.rho * self.cp / 3.6e6  # in kWh
-
-                    if remaining_heat > 0:
-                        if remaining_heat >= max_heat_in_layer:
-                            # Schicht wird komplett aufgeheizt
-                            heat_stored_per_layer[i] += max_heat_in_layer
-                            self.T_sto_layers[t, i] = self.T_max  # Maximaltemperatur erreicht
-                            remaining_heat -= max_heat_in_layer  # Restwärme geht in die nächste Schicht
-                        else:
-                            # Schicht wird nur teilweise aufgeheizt
-                            heat_stored_per_layer[i] += remaining_heat
-                            self.T_sto_layers[t, i] = self.T_sto_layers[t-1, i] + (remaining_heat * 3.6e6) / (self.layer_volume * self.rho * self.cp)
-                            remaining_heat = 0  # Keine Restwärme mehr
-                    else:
-                        # Falls keine Restwärme vorhanden ist, bleibt die Temperatur konstant
-                        self.T_sto_layers[t, i] = self.T_sto_layers[t-1, i]
-
-                    # Begrenze die Temperatur, falls sie unter die Minimaltemperatur fällt
-                    if self.T_sto_layers[t, i] < self.T_min:
-                        self.T_sto_layers[t, i] = self.T_min
-
-                # Berechne den Wärmetransport zwischen benachbarten Schichten
-                for i in range(self.num_layers - 1):
-                    # Berechnung des Wärmeflusses zwischen Schicht i und i+1
-                    delta_T = self.T_sto_layers[t, i] - self.T_sto_layers[t, i + 1]
-                    heat_transfer = self.thermal_conductivity * self.S_side * delta_T / self.layer_thickness  # W = J/s
-                    
-                    # Umrechnung in kWh für den Zeitintervall (1 Stunde = 3600 Sekunden)
-                    heat_transfer_kWh = heat_transfer / 3.6e6 * 3600  # kWh pro Stunde
-                    
-                    # Wärme von der oberen Schicht (i) abziehen und in die untere Schicht (i+1) hinzufügen
-                    heat_stored_per_layer[i] -= heat_transfer_kWh
-                    heat_stored_per_layer[i + 1] += heat_transfer_kWh
+            # Seitenfläche zwischen zwei Z-Koordinaten sowie Boden- und Deckfläche als Kreissegmente
+            side = np.stack([bottom_0, bottom_1, top_1, top_0], axis=2)
+            bottom = np.stack([bottom_center, bottom_0, bottom_1, bottom_center], axis=2)
+            top = np.stack([top_center, top_0, top_1, top_center], axis=2)
+            return np.concatenate([side, bottom, top], axis=1)
 
-                    # Aktualisiere die Temperaturen basierend auf dem neuen Wärmeinhalt
-                    self.T_sto_layers[t, i] = (heat_stored_per_layer[i] * 3.6e6) / (self.layer_volume * self.rho * self.cp) + self.T_ref
-                    self.T_sto_layers[t, i + 1] = (heat_stored_per_layer[i + 1] * 3.6e6) / (self.layer_volume * self.rho * self.cp) + self.T_ref
+        elif self.storage_type == "truncated_trapezoid":
+            # Ecken aller Schichtübergänge gegen den Uhrzeigersinn, shape (num_layers + 1, 4, 3)
+            x_sign = np.array([-1.0, 1.0, 1.0, -1.0])
+            y_sign = np.array([-1.0, -1.0, 1.0, 1.0])
+            corners = np.stack([x_sign * self._lengths[:, None] / 2, y_sign * self._widths[:, None] / 2,
+                                np.broadcast_to(z_layers[:, None], (num_layers + 1, 4))], axis=-1)
+            bottom, top = corners[:-1], corners[1:]
+
+            # Bottom, top and the four side faces
+            next_corner = [1, 2, 3, 0]
+            sides = np.stack([bottom, bottom[:, next_corner], top[:, next_corner], top], axis=2)
+            return np.concatenate([bottom[:, None], top[:, None], sides], axis=1)
 
-                # Berechne die Gesamtwärme im Speicher
-                self.Q_sto[t] = np.sum(heat_stored_per_layer)  # Gespeicherte Wärme in kWh
+        else:
+            raise ValueError("Unsupported storage type for 3D plot")
 
-            # Aktualisiere die Hauptspeichertemperatur als Durchschnittstemperatur der Schichten
-            self.T_sto[t] = np.average(self.T_sto_layers[t])
+    def _init_artists(self, ax):
+        """Create the Poly3DCollection holding all layers of the storage once per axes."""
+        if ax in self._plot_collections:
+            return  # Geometrie unverändert, nur die Farben werden neu gesetzt
+        if self._plot_vertices is None:
+            self._plot_vertices = self.calculate_plot_vertices()
+        verts = self._plot_vertices
+        self._quads_per_layer = verts.shape[1]
+        self._facecolor_buffer = np.empty((verts.shape[0], self._quads_per_layer, 4))  # RGBA per quad, refilled every frame
+        verts = verts.reshape(-1, 4, 3)
+
+        collection = Poly3DCollection(verts, alpha=0.7, edgecolor='none', linewidth=0)  # Flächen ohne Kanten, nur Farbe
+        ax.add_collection3d(collection)
+        self._plot_collections[ax] = collection
+        ax.auto_scale_xyz(verts[:, :, 0], verts[:, :, 1], verts[:, :, 2])
+
+    def _layer_colors(self, time_step):
+        """RGBA color of each plotted layer (bottom to top) for the given time step."""
+        # Temperaturwerte umkehren, sodass heiß oben ist
+        T_layers_reversed = self.T_sto_layers[time_step, ::-1]
+        color_values = (T_layers_reversed - self.T_min) / (self.T_max - self.T_min)
+        lut_size = len(self._cmap_lut)
+        return self._cmap_lut[np.clip((color_values * lut_size).astype(np.int32), 0, lut_size - 1)]
+
+    def _update_artists(self, ax, time_step):
+        """Update only the layer colors of the collection on the given axes for the given time step."""
+        collection = self._plot_collections[ax]
+        colors = self._layer_colors(time_step)
+        self._facecolor_buffer[:] = colors[:, None, :]  # Broadcast layer colour onto all its quads
+        collection.set_facecolors(self._facecolor_buffer.reshape(-1, 4))  # Copies the buffer, so it can be shared by all axes
+        return collection
 
-        self.calculate_efficiency(Q_in)
-        
     def plot_3d_temperature_distribution(self, ax, time_step):
-        """3D plot to visualize the temperature stratification in the storage as filled layers (cylinder or rectangular)."""
-        if self.storage_type == "cylindrical":
-            radius, height = self.dimensions
-            
-            # Zylinder-Koordinaten für die Schichtunterteilungen
-            z_layers = np.linspace(0, height, self.T_sto_layers.shape[1] + 1)  # Höhenkoordinaten für die Schichtenübergänge
-            theta = np.linspace(0, 2 * np.pi, 50)  # Winkelkoordinaten für den Zylinder
-            theta_grid, z_grid = np.meshgrid(theta, z_layers)
-            x_grid = radius * np.cos(theta_grid)
-            y_grid = radius * np.sin(theta_grid)
-
-            # Umkehren der Z-Koordinaten und Temperaturwerte, sodass heiß oben ist
-            z_layers = np.flip(z_layers)  # Z-Koordinaten umkehren
-            T_layers_reversed = np.flip(self.T_sto_layers[time_step])  # Temperatur-Schichten umkehren
-
-            # Plot each layer as a filled cylinder between two z-levels
-            for i in range(self.T_sto_layers.shape[1]):
-                color_value = (self.T_sto_layers[time_step, i] - self.T_min) / (self.T_max - self.T_min)
-                color = plt.cm.coolwarm(color_value)  # Color gradient based on temperature
-                color_value_reversed = (T_layers_reversed[i] - self.T_min) / (self.T_max - self.T_min)
-                color_reversed = plt.cm.coolwarm(color_value_reversed)  # Farbverlauf basierend auf der Temperatur
-
-                # Erstelle eine 2D-Matrix für die facecolors basierend auf der Temperatur
-                facecolors = np.tile(color_reversed[:3], (x_grid.shape[0], x_grid.shape[1], 1))
-
-                # Zylinderoberfläche plotten
-                ax.plot_surface(x_grid, y_grid, z_grid[i] * np.ones_like(x_grid), facecolors=facecolors, rstride=1, cstride=1, alpha=0.7)
-                ax.plot_surface(x_grid, y_grid, z_grid[i+1] * np.ones_like(x_grid), facecolors=facecolors, rstride=1, cstride=1, alpha=0.7)
-
-                # Plot der vertikalen Seitenflächen zwischen zwei Z-Koordinaten
-                for j in range(x_grid.shape[1] - 1):
-                    ax.plot([x_grid[0, j], x_grid[0, j + 1]], [y_grid[0, j], y_grid[0, j + 1]], [z_layers[i], z_layers[i]], color=color[:3], alpha=0.7)
-                    ax.plot([x_grid[-1, j], x_grid[-1, j + 1]], [y_grid[-1, j], y_grid[-1, j + 1]], [z_layers[i + 1], z_layers[i + 1]], color=color[:3], alpha=0.7)
-                    
-                    # Schließt die vertikalen Seitenflächen ab
-                    ax.plot([x_grid[0, j], x_grid[0, j]], [y_grid[0, j], y_grid[0, j]], [z_layers[i], z_layers[i + 1]], color=color[:3], alpha=0.7)
-                    ax.plot([x_grid[-1, j], x_grid[-1, j]], [y_grid[-1, j], y_grid[-1, j]], [z_layers[i], z_layers[i + 1]], color=color[:3], alpha=0.7)
-
-        if self.storage_type == "truncated_cone":
-            """3D plot to visualize the temperature stratification in a truncated cone PTES."""
-            top_radius, bottom_radius, height = self.dimensions
-            z_layers = np.linspace(0, height, self.T_sto_layers.shape[1] + 1)
-            
-            # Zylinder-Koordinaten für die Schichtunterteilungen
-            theta = np.linspace(0, 2 * np.pi, 50)  # Winkelkoordinaten für den Zylinder
-            
-            # Calculate the radius for each z-layer based on the linear slope
-            radii = np.linspace(bottom_radius, top_radius, len(z_layers))
-            
-            for i in range(self.T_sto_layers.shape[1]):
-                # Matching dimensions for x_grid, y_grid, and z_grid
-                theta_grid, z_grid = np.meshgrid(theta, z_layers[i:i+2])
-                x_grid = np.outer(np.cos(theta), radii[i:i+2])
-                y_grid = np.outer(np.sin(theta), radii[i:i+2])
-
-                color_value_reversed = (np.flip(self.T_sto_layers[time_step])[i] - self.T_min) / (self.T_max - self.T_min)
-                color_reversed = plt.cm.coolwarm(color_value_reversed)
-
-                facecolors = np.tile(color_reversed[:3], (x_grid.shape[0], x_grid.shape[1], 1))
-
-                # Plot the surface with correctly shaped arrays
-                ax.plot_surface(x_grid, y_grid, np.transpose(z_grid), facecolors=facecolors, rstride=1, cstride=1, alpha=0.7)
-
-
-        if self.storage_type == "truncated_trapezoid":
-            """3D plot to visualize the temperature stratification in a truncated trapezoid PTES."""
-            # Swap top and bottom dimensions to ensure the narrow end is at the bottom
-            bottom_length, bottom_width, top_length, top_width, height = self.dimensions
-
-            z_layers = np.linspace(0, height, self.T_sto_layers.shape[1] + 1)
-
-            # Calculate length and width at each z-layer based on linear slope
-            lengths = np.linspace(bottom_length, top_length, len(z_layers))
-            widths = np.linspace(bottom_width, top_width, len(z_layers))
-
-            for i in range(self.T_sto_layers.shape[1]):
-                # Bottom and top layer coordinates
-                r_bottom = [-lengths[i] / 2, lengths[i] / 2]
-                s_bottom = [-widths[i] / 2, widths[i] / 2]
-                r_top = [-lengths[i+1] / 2, lengths[i+1] / 2]
-                s_top = [-widths[i+1] / 2, widths[i+1] / 2]
-                t_bottom = z_layers[i]
-                t_top = z_layers[i + 1]
-
-                color_value_reversed = (np.flip(self.T_sto_layers[time_step])[i] - self.T_min) / (self.T_max - self.T_min)
-                color_reversed = plt.cm.coolwarm(color_value_reversed)
-
-                # Create a 2D array for the facecolors
-                facecolors = np.tile(color_reversed[:3], (2, 4, 1))
-
-                # Plot bottom and top surfaces
-                ax.plot_surface(np.array([[r_bottom[0], r_bottom[0], r_bottom[1], r_bottom[1]],
-                                        [r_top[0], r_top[0], r_top[1], r_top[1]]]),
-                                np.array([[s_bottom[0], s_bottom[1], s_bottom[1], s_bottom[0]],
-                                        [s_top[0], s_top[1], s_top[1], s_top[0]]]),
-                                np.array([[t_bottom, t_bottom, t_bottom, t_bottom],
-                                        [t_top, t_top, t_top, t_top]]),
-                                facecolors=facecolors, rstride=1, cstride=1, alpha=0.7)
-
-                # Plot side faces (ensuring all walls are plotted)
-                ax.plot_surface(np.array([[r_bottom[0], r_top[0]], [r_bottom[1], r_top[1]]]),
-                                np.array([[s_bottom[0], s_top[0]], [s_bottom[0], s_top[0]]]),
-                                np.array([[t_bottom, t_top], [t_bottom, t_top]]),
-                                facecolors=np.tile(color_reversed[:3], (2, 2, 1)), alpha=0.7)
-
-                ax.plot_surface(np.array([[r_bottom[0], r_top[0]], [r_bottom[1], r_top[1]]]),
-                                np.array([[s_bottom[1], s_top[1]], [s_bottom[1], s_top[1]]]),
-                                np.array([[t_bottom, t_top], [t_bottom, t_top]]),
-                                facecolors=np.tile(color_reversed[:3], (2, 2, 1)), alpha=0.7)
-
-                ax.plot_surface(np.array([[r_bottom[0], r_bottom[0]], [r_top[0], r_top[0]]]),
-                                np.array([[s_bottom[0], s_top[0]], [s_bottom[1], s_top[1]]]),
-                                np.array([[t_bottom, t_top], [t_bottom, t_top]]),
-                                facecolors=np.tile(color_reversed[:3], (2, 2, 1)), alpha=0.7)
-
-                # Ensure bottom closure
-                ax.plot_surface(np.array([[r_bottom[0], r_bottom[1]]]),
-                                np.array([[s_bottom[0], s_bottom[1]]]),
-                                np.array([[t_bottom, t_bottom]]),
-                                color=color_reversed[:3], alpha=0.7)
-        else:
-            raise ValueError("Unsupported storage type for 3D plot")
+        """3D plot to visualize the temperature stratification in the storage as filled layers (cylinder, truncated cone or trapezoid)."""
+        self._init_artists(ax)
+        self._update_artists(ax, time_step)
 
         # Add labels, title, and color bar only if they haven't been added before
         if not self.labels_exist:
@@ -705,58 +759,85 @@ class StratifiedThermalStorage(ThermalStorage):
 
         if not self.colorbar_exists:
             # Hinzufügen einer Farbskala zur Veranschaulichung der Temperatur
-            mappable = plt.cm.ScalarMappable(cmap=plt.cm.coolwarm)
-            mappable.set_array([self.T_min, self.T_max])
-            cbar = plt.colorbar(mappable, ax=ax, shrink=0.5, aspect=5)
+            cbar = plt.colorbar(self._sm, ax=ax, shrink=0.5, aspect=5)
             cbar.set_label('Temperature (°C)')
             self.colorbar_exists = True  # Set flag to prevent re-drawing
     
-    def plot_results(self):
-            fig = plt.figure(figsize=(16, 10))
-            axs1 = fig.add_subplot(2, 3, 1)
-            axs2 = fig.add_subplot(2, 3, 2)
-            axs3 = fig.add_subplot(2, 3, 3)
-            axs4 = fig.add_subplot(2, 3, 4)
-            axs5 = fig.add_subplot(2, 3, 5)
-            axs6 = fig.add_subplot(2, 3, 6, projection='3d')
-
-            # Q_in and Q_out
-            axs1.plot(self.Q_in, label='Heat Input', color='red')
-            axs1.plot(self.Q_out, label='Heat Output', color='blue')
-            axs1.set_ylabel('Heat (kW)')
-            axs1.set_title('Heat Input and Output over Time')
-            axs1.legend()
-
-            # Plot storage temperature
-            axs2.plot(self.T_sto, label='Storage Temperature')
-            axs2.set_ylabel('Temperature (°C)')
-            axs2.set_title(f'Storage Temperature over Time ({self.storage_type.capitalize()} Storage)')
-            axs2.legend()
-
-            # Plot heat loss
-            axs3.plot(self.Q_loss, label='Heat Loss', color='orange')
-            axs3.set_ylabel('Heat Loss (kW)')
-            axs3.set_title('Heat Loss over Time')
-            axs3.legend()
-
-            # Plot stored heat
-            axs4.plot(self.Q_sto, label='Stored Heat', color='green')
-            axs4.set_ylabel('Stored Heat (kWh)')
-            axs4.set_title('Stored Heat over Time')
-            axs4.legend()
-
-            # Plot stratified storage temperatures
-            for i in range(self.T_sto_layers.shape[1]):
-                axs5.plot(self.T_sto_layers[:, i], label=f'Layer {i+1}')
-            axs5.set_xlabel('Time (hours)')
-            axs5.set_ylabel('Temperature (°C)')
-            axs5.set_title('Stratified Storage Temperatures')
-            axs5.legend()
-
-            # Plot 3D geometry
-            self.plot_3d_temperature_distribution(axs6, 6000)
-
-            plt.tight_layout()
+    def plot_results(self, time_step=6000):
+        """Plot the simulation results. The figure is built once and only its data is updated on further calls while it is open."""
+        if self._results_figure is None or not plt.fignum_exists(self._results_figure.number):
+            self._build_panels()
+        self._update_panels(time_step)
+
+    def _build_panels(self):
+        """Create the result figure with empty lines, the handles are kept for _update_panels."""
+        fig = plt.figure(figsize=(16, 10))
+        axs1 = fig.add_subplot(2, 3, 1)
+        axs2 = fig.add_subplot(2, 3, 2)
+        axs3 = fig.add_subplot(2, 3, 3)
+        axs4 = fig.add_subplot(2, 3, 4)
+        axs5 = fig.add_subplot(2, 3, 5)
+        axs6 = fig.add_subplot(2, 3, 6, projection='3d')
+
+        # Q_in and Q_out
+        self._line_Q_in, = axs1.plot([], label='Heat Input', color='red')
+        self._line_Q_out, = axs1.plot([], label='Heat Output', color='blue')
+        axs1.set_ylabel('Heat (kW)')
+        axs1.set_title('Heat Input and Output over Time')
+        axs1.legend()
+
+        # Plot storage temperature
+        self._line_T_sto, = axs2.plot([], label='Storage Temperature')
+        axs2.set_ylabel('Temperature (°C)')
+        axs2.set_title(f'Storage Temperature over Time ({self.storage_type.capitalize()} Storage)')
+        axs2.legend()
+
+        # Plot heat loss
+        self._line_Q_loss, = axs3.plot([], label='Heat Loss', color='orange')
+        axs3.set_ylabel('Heat Loss (kW)')
+        axs3.set_title('Heat Loss over Time')
+        axs3.legend()
+
+        # Plot stored heat
+        self._line_Q_sto, = axs4.plot([], label='Stored Heat', color='green')
+        axs4.set_ylabel('Stored Heat (kWh)')
+        axs4.set_title('Stored Heat over Time')
+        axs4.legend()
+
+        # Plot stratified storage temperatures
+        self._lines_T_layers = [axs5.plot([], label=f'Layer {i+1}')[0] for i in range(self.num_layers)]
+        axs5.set_xlabel('Time (hours)')
+        axs5.set_ylabel('Temperature (°C)')
+        axs5.set_title('Stratified Storage Temperatures')
+        axs5.legend()
+
+        self._results_figure = fig
+        self._results_axes = (axs1, axs2, axs3, axs4, axs5, axs6)
+        self.labels_exist = False  # Neue 3D-Achse braucht Beschriftung und Farbskala
+        self.colorbar_exists = False
+
+    def _update_panels(self, time_step):
+        """Set the current simulation results on the existing lines and recolor the 3D geometry."""
+        axs1, axs2, axs3, axs4, axs5, axs6 = self._results_axes
+        hours = np.arange(self.hours)
+
+        self._line_Q_in.set_data(hours, self.Q_in)
+        self._line_Q_out.set_data(hours, self.Q_out)
+        self._line_T_sto.set_data(hours, self.T_sto)
+        self._line_Q_loss.set_data(hours, self.Q_loss)
+        self._line_Q_sto.set_data(hours, self.Q_sto)
+        for i, line in enumerate(self._lines_T_layers):
+            line.set_data(hours, self.T_sto_layers[:, i])
+
+        for ax in (axs1, axs2, axs3, axs4, axs5):
+            ax.relim()
+            ax.autoscale_view()
+
+        # Plot 3D geometry
+        self.plot_3d_temperature_distribution(axs6, time_step)
+
+        self._results_figure.tight_layout()
+        self._results_figure.canvas.draw_idle()
 
 class TemperatureStratifiedThermalStorage(StratifiedThermalStorage):
     def __init__(self, **kwargs):
@@ -791,37 +872,49 @@ class TemperatureStratifiedThermalStorage(StratifiedThermalStorage):
         self.T_Q_in_flow = T_Q_in_flow_copy  # Vorlauf-Erzeuger
         self.T_Q_out_return = T_Q_out_return_copy  # Rücklauf-Verbraucher
 
-        for t in range(0, self.hours):
+        # Lokale Referenzen für die Zeitschleife
+        hours, num_layers = self.hours, self.num_layers
+        rho, cp = self.rho, self.cp
+        layer_volume, layer_thickness = self.layer_volume, self.layer_thickness
+        thermal_conductivity, S_side = self.thermal_conductivity, self.S_side
+        T_sto, Q_sto, Q_loss = self.T_sto, self.Q_sto, self.Q_loss
+        mass_flow_in, mass_flow_out = self.mass_flow_in, self.mass_flow_out
+        T_Q_in_return, T_Q_out_flow = self.T_Q_in_return, self.T_Q_out_flow
+
+        self.T_sto_layers = np.full((hours, num_layers), T_sto[0])  # Initialisiere Schichttemperaturen, T_sto[0] = Anfangstemperatur, alle Schichten haben die gleiche Temperatur
+        T_sto_layers = self.T_sto_layers
+
+        for t in range(0, hours):
             if t == 0:
-                self.T_sto_layers = np.full((self.hours, self.num_layers), self.T_sto[t])  # Initialisiere Schichttemperaturen, T_sto[0] = Anfangstemperatur, alle Schichten haben die gleiche Temperatur
-                self.Q_loss[t] = self.calculate_stratified_heat_loss(self.T_sto_layers[t])  # Berechne die Wärmeverluste
-                heat_stored_per_layer = self.layer_volume * self.rho * self.cp * (self.T_sto[t] - self.T_Q_out_return[t]) / 3.6e6  # Wärme in jeder Schicht bezogen auf die Rücklauftemperatur bei t=0 in kWh
-                self.Q_sto[t] = sum(heat_stored_per_layer) # Gespeicherte Wärme in kWh
+                Q_loss[t] = self.calculate_stratified_heat_loss(T_sto_layers[t])  # Berechne die Wärmeverluste
+                heat_stored_per_layer = layer_volume * rho * cp * (T_sto[t] - T_Q_out_return_copy[t]) / 3.6e6  # Wärme in jeder Schicht bezogen auf die Rücklauftemperatur bei t=0 in kWh
+                Q_sto[t] = sum(heat_stored_per_layer) # Gespeicherte Wärme in kWh
 
             else:
                 ### Berchnung der Wärmeverluste und Wärmeleitung zwischen den Schichten ###
                 # 1.1 **Berechnung der Wärmeverluste nach außen (basierend auf Schichttemperaturen)**
-                self.Q_loss[t] = self.calculate_stratified_heat_loss(self.T_sto_layers[t - 1])
+                Q_loss[t] = self.calculate_stratified_heat_loss(T_sto_layers[t - 1])
+                Q_loss_layers = self.Q_loss_layers
 
                 # 1.2 **Berechnung der Wärmeverluste nach außen (basierend auf Schichttemperaturen)**
-                for i in range(self.num_layers):
+                for i in range(num_layers):
                     # Berechne den Wärmeverlust für die Schicht
-                    Q_loss_layer = self.Q_loss_layers[i]  # Wärmeverlust in kWh
+                    Q_loss_layer = Q_loss_layers[i]  # Wärmeverlust in kWh
 
                     # Ziehe Wärmeverluste von der gespeicherten Wärme in der Schicht ab
                     heat_stored_per_layer[i] -= Q_loss_layer / 3600  # Wärmeverlust in kWh
 
                     # Berechne die Temperaturänderung aufgrund des Wärmeverlustes
                     # delta_T = Q_loss_layer / (m * cp), wobei m = rho * volume der Schicht
-                    delta_T = (Q_loss_layer * 3.6e6) / (self.layer_volume[i] * self.rho * self.cp)  # in °C
+                    delta_T = (Q_loss_layer * 3.6e6) / (layer_volume[i] * rho * cp)  # in °C
 
                     # Aktualisiere die Temperatur der Schicht basierend auf der Temperaturänderung
-                    self.T_sto_layers[t, i] = self.T_sto_layers[t - 1, i] - delta_T  # Temperaturverlust
+                    T_sto_layers[t, i] = T_sto_layers[t - 1, i] - delta_T  # Temperaturverlust
 
                 # 2. **Berechnung der Wärmeleitung innerhalb des Speichers (zwischen den Schichten)**
-                for i in range(self.num_layers - 1):
-                    delta_T = self.T_sto_layers[t - 1, i] - self.T_sto_layers[t - 1, i + 1]
-                    heat_transfer = self.thermal_conductivity * self.S_side * delta_T / self.layer_thickness  # W = J/s
+                for i in range(num_layers - 1):
+                    delta_T = T_sto_layers[t - 1, i] - T_sto_layers[t - 1, i + 1]
+                    heat_transfer = thermal_conductivity * S_side * delta_T / layer_thickness  # W = J/s
                     heat_transfer_kWh = heat_transfer / 3.6e6 * 3600  # kWh pro Stunde
 
                     # Wärme von Schicht i abziehen und zur Schicht i+1 hinzufügen
@@ -829,86 +922,86 @@ class TemperatureStratifiedThermalStorage(StratifiedThermalStorage):
                     heat_stored_per_layer[i + 1] += heat_transfer_kWh
 
                     # Aktualisiere die Temperaturen basierend auf dem neuen Wärmeinhalt
-                    delta_T_transfer = heat_transfer_kWh * 3.6e6 / (self.layer_volume[i] * self.rho * self.cp)  # in °C
+                    delta_T_transfer = heat_transfer_kWh * 3.6e6 / (layer_volume[i] * rho * cp)  # in °C
 
                     # Temperaturanpassung für die beiden benachbarten Schichten
-                    self.T_sto_layers[t, i] -= delta_T_transfer  # Schicht i verliert Wärme
-                    self.T_sto_layers[t, i + 1] += delta_T_transfer  # Schicht i+1 gewinnt Wärme
+                    T_sto_layers[t, i] -= delta_T_transfer  # Schicht i verliert Wärme
+                    T_sto_layers[t, i + 1] += delta_T_transfer  # Schicht i+1 gewinnt Wärme
 
                 ### Be- und Entladen der Schichten basierend auf den Massenströmen und Temperaturen ###
                 # **Speicherleer- und Speicherfüllstatus prüfen**
                 # Aktualisiere die Hauptspeichertemperatur als Durchschnittstemperatur der Schichten
-                self.T_sto[t] = np.average(self.T_sto_layers[t])
-                available_energy_in_storage = np.sum([(self.T_sto[t] - self.T_Q_out_return[t]) * self.layer_volume[i] * self.rho * self.cp / 3.6e6 for i in range(self.num_layers)])  # Energie über T_min in kWh
-                max_possible_energy = np.sum([(self.T_Q_in_flow[t] - self.T_Q_out_return[t]) * self.layer_volume[i] * self.rho * self.cp / 3.6e6 for i in range(self.num_layers)])  # Maximale Energie in kWh
+                T_sto[t] = T_sto_layers[t].mean()
+                available_energy_in_storage = np.sum([(T_sto[t] - T_Q_out_return_copy[t]) * layer_volume[i] * rho * cp / 3.6e6 for i in range(num_layers)])  # Energie über T_min in kWh
+                max_possible_energy = np.sum([(T_Q_in_flow_copy[t] - T_Q_out_return_copy[t]) * layer_volume[i] * rho * cp / 3.6e6 for i in range(num_layers)])  # Maximale Energie in kWh
                 
                 # Speicher voll (keine weitere Aufnahme)
                 if available_energy_in_storage >= max_possible_energy*0.95:# and self.Q_in[t] > self.Q_out[t]:
-                    self.excess_heat += self.Q_in[t] # Überschüssige Wärme
+                    self.excess_heat += Q_in_copy[t] # Überschüssige Wärme
                     self.stagnation_time += 1  # Stagnationszeit um eine Stunde erhöhen
-                    self.Q_in[t] = 0  # Keine weitere Wärmezufuhr
+                    Q_in_copy[t] = 0  # Keine weitere Wärmezufuhr
 
                 # Speicher leer (keine weitere Entnahme)
                 if available_energy_in_storage <= max_possible_energy*0.05:# and self.Q_out[t] > self.Q_in[t]:
-                    self.unmet_demand += self.Q_out[t] # Nicht gedeckter Bedarf
-                    self.Q_out[t] = 0  # Keine weitere Wärmeentnahme
+                    self.unmet_demand += Q_out_copy[t] # Nicht gedeckter Bedarf
+                    Q_out_copy[t] = 0  # Keine weitere Wärmeentnahme
 
                 # Berechne den Massenstrom für Input und Output (kg/s)
-                if T_Q_in_flow[t] - self.T_sto_layers[t, 0] != 0:  # Vermeide Division durch Null
-                    self.mass_flow_in[t] = (self.Q_in[t] * 1000) / (self.cp * (T_Q_in_flow[t] - self.T_sto_layers[t, -1]))  # kg/s für Erzeuger 
+                if T_Q_in_flow[t] - T_sto_layers[t, 0] != 0:  # Vermeide Division durch Null
+                    mass_flow_in[t] = (Q_in_copy[t] * 1000) / (cp * (T_Q_in_flow[t] - T_sto_layers[t, -1]))  # kg/s für Erzeuger 
                 else:
-                    self.mass_flow_in[t] = 0
+                    mass_flow_in[t] = 0
 
-                if self.T_sto_layers[t, -1] - T_Q_out_return[t] != 0:  # Vermeide Division durch Null
-                    self.mass_flow_out[t] = (self.Q_out[t] * 1000) / (self.cp * (self.T_sto_layers[t, 0] - T_Q_out_return[t]))  # kg/s für Verbraucher
+                if T_sto_layers[t, -1] - T_Q_out_return[t] != 0:  # Vermeide Division durch Null
+                    mass_flow_out[t] = (Q_out_copy[t] * 1000) / (cp * (T_sto_layers[t, 0] - T_Q_out_return[t]))  # kg/s für Verbraucher
                 else:
-                    self.mass_flow_out[t] = 0
+                    mass_flow_out[t] = 0
 
                 # 3. **Wärmeeinströmung (von oben nach unten)**
-                for i in range(self.num_layers):
+                for i in range(num_layers):
                     # Berechne die Mischtemperatur in Kelvin zwischen der Schicht und dem einströmenden Medium
-                    mix_temp_K = ((self.mass_flow_in[t] * self.cp * (T_Q_in_flow[t] + 273.15) * 3600) + 
-                                (self.layer_volume[i] * self.rho * self.cp * (self.T_sto_layers[t, i] + 273.15))) / \
-                                ((self.mass_flow_in[t] * self.cp * 3600) + 
-                                (self.layer_volume[i] * self.rho * self.cp))
+                    mix_temp_K = ((mass_flow_in[t] * cp * (T_Q_in_flow[t] + 273.15) * 3600) + 
+                                (layer_volume[i] * rho * cp * (T_sto_layers[t, i] + 273.15))) / \
+                                ((mass_flow_in[t] * cp * 3600) + 
+                                (layer_volume[i] * rho * cp))
 
                     # Berechne die zugeführte Wärme und füge sie der Schicht hinzu
-                    added_heat = self.mass_flow_in[t] * self.cp * (T_Q_in_flow[t] - self.T_sto_layers[t, i]) * 3600  # in J
+                    added_heat = mass_flow_in[t] * cp * (T_Q_in_flow[t] - T_sto_layers[t, i]) * 3600  # in J
                     heat_stored_per_layer[i] += added_heat / 3.6e6  # in kWh
 
                     # Die neue Temperatur der Schicht ist die Mischtemperatur (wieder in °C umrechnen)
-                    self.T_sto_layers[t, i] = mix_temp_K - 273.15
+                    T_sto_layers[t, i] = mix_temp_K - 273.15
 
                     # Aktualisiere die Vorlauftemperatur für die nächste Schicht
-                    T_Q_in_flow[t] = self.T_sto_layers[t, i]
+                    T_Q_in_flow[t] = T_sto_layers[t, i]
 
                 # 4. **Wärmeausströmung (von unten nach oben)**
-                for i in range(self.num_layers - 1, -1, -1):
+                for i in range(num_layers - 1, -1, -1):
                     # Berechne die Mischtemperatur in Kelvin zwischen der Schicht und dem ausströmenden Medium
-                    mix_temp_K = ((self.mass_flow_out[t] * self.cp * (T_Q_out_return[t] + 273.15) * 3600) + 
-                                (self.layer_volume[i] * self.rho * self.cp * (self.T_sto_layers[t, i] + 273.15))) / \
-                                ((self.mass_flow_out[t] * self.cp * 3600) + 
-                                (self.layer_volume[i] * self.rho * self.cp))
+                    mix_temp_K = ((mass_flow_out[t] * cp * (T_Q_out_return[t] + 273.15) * 3600) + 
+                                (layer_volume[i] * rho * cp * (T_sto_layers[t, i] + 273.15))) / \
+                                ((mass_flow_out[t] * cp * 3600) + 
+                                (layer_volume[i] * rho * cp))
 
                     # Berechne die abgeführte Wärme und ziehe sie von der Schicht ab
-                    removed_heat = self.mass_flow_out[t] * self.cp * (self.T_sto_layers[t, i] - T_Q_out_return[t]) * 3600  # in J
+                    removed_heat = mass_flow_out[t] * cp * (T_sto_layers[t, i] - T_Q_out_return[t]) * 3600  # in J
                     heat_stored_per_layer[i] -= removed_heat / 3.6e6  # in kWh
 
                     # Die neue Temperatur der Schicht ist die Mischtemperatur (wieder in °C umrechnen)
-                    self.T_sto_layers[t, i] = mix_temp_K - 273.15
+                    T_sto_layers[t, i] = mix_temp_K - 273.15
 
                     # Aktualisiere die Rücklauftemperatur für die nächste Schicht
-                    T_Q_out_return[t] = self.T_sto_layers[t, i]# **Wärme einströmen lassen (von oben nach unten):**
+                    T_Q_out_return[t] = T_sto_layers[t, i]# **Wärme einströmen lassen (von oben nach unten):**
 
                 # Berechne die Gesamtwärme im Speicher
-                self.Q_sto[t] = np.sum(heat_stored_per_layer)  # Gespeicherte Wärme in kWh
+                Q_sto[t] = np.sum(heat_stored_per_layer)  # Gespeicherte Wärme in kWh
 
                 # Aktualisiere die Hauptspeichertemperatur als Durchschnittstemperatur der Schichten
-                self.T_sto[t] = np.average(self.T_sto_layers[t])
+                T_sto[t] = T_sto_layers[t].mean()
 
             # Berechnung der Rücklauftemperaturen:
-            self.T_Q_in_return[t] = self.T_sto_layers[t, 0]  # Rücklauftemperatur für Erzeuger
-            self.T_Q_out_flow[t] = self.T_sto_layers[t, -1]  # Vorlauftemperatur für Verbraucher
+            T_Q_in_return[t] = T_sto_layers[t, 0]  # Rücklauftemperatur für Erzeuger
+            T_Q_out_flow[t] = T_sto_layers[t, -1]  # Vorlauftemperatur für Verbraucher
 
         self.calculate_efficiency(self.Q_in)
 
@@ -999,10 +1092,11 @@ if __name__ == '__main__':
     temperature_stratified_STES = TemperatureStratifiedThermalStorage(**params) # Stratified Seasonal Thermal Energy Storage with Mass Flows
 
     # Simulated heat input and output (example random values)
-    Q_in = np.random.uniform(450, 455, params['hours'])  # Heat input in kW
-    #Q_out = np.random.uniform(100, 200, params['hours'])  # Heat output in kW
-    T_Q_in_flow = np.random.uniform(85, 85, params['hours'])  # Input flow temperature in °C
-    T_Q_out_return = np.random.uniform(50, 50, params['hours'])  # Output return temperature in °C
+    rng = np.random.default_rng(0)  # Reproducible example data
+    Q_in = rng.uniform(450, 455, params['hours'])  # Heat input in kW
+    #Q_out = rng.uniform(100, 200, params['hours'])  # Heat output in kW
+    T_Q_in_flow = np.full(params['hours'], 85.0)  # Input flow temperature in °C
+    T_Q_out_return = np.full(params['hours'], 50.0)  # Output return temperature in °C
 
     # Load Q_out from Lastgang.csv
     file_path = os.path.abspath('currently_not_used\STES\Lastgang.csv')
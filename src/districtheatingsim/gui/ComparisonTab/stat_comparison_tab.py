@@ -6,204 +6,191 @@ Description: Contains the StatComparisonTab.
 """
 
 import os
+import functools
 import pandapipes as pp
-import csv
 import json
 import numpy as np
+import pandas as pd
 import traceback
 
-from PyQt5.QtWidgets import QWidget, QVBoxLayout, QPushButton, QTableWidget, QTableWidgetItem, QFileDialog, QHBoxLayout, QMessageBox
+from PyQt5.QtCore import QThread, pyqtSignal, pyqtSlot
+from PyQt5.QtGui import QStandardItemModel, QStandardItem
+from PyQt5.QtWidgets import QWidget, QVBoxLayout, QPushButton, QTableView, QFileDialog, QHBoxLayout, QMessageBox
 
+from districtheatingsim.gui.dialogs import FILE_DIALOG_OPTIONS
 from districtheatingsim.net_simulation_pandapipes.pp_net_time_series_simulation import import_results_csv
 
-class StatComparisonTab(QWidget):
-    def __init__(self, folder_manager, config_manager, parent=None):
-        super().__init__(parent)
-        self.folder_manager = folder_manager
-        self.config_manager = config_manager
-        self.folder_paths = []
-        self.variant_data = []
-
-        # Connect to the data manager signal
-        self.folder_manager.project_folder_changed.connect(self.updateDefaultPath)
-        self.updateDefaultPath(self.folder_manager.variant_folder)
-
-        self.initUI()
-
-    def updateDefaultPath(self, new_base_path):
-        self.base_path = new_base_path
+# Die Caches sind über (Pfad, mtime) geschlüsselt, damit eine geänderte Datei neu eingelesen wird.
+# Die Ergebnisse werden im Vergleichstab nur gelesen und können daher zwischen Varianten geteilt werden.
+@functools.lru_cache(maxsize=16)
+def _cached_from_pickle(path, mtime):
+    return pp.from_pickle(path)
 
-    def initUI(self):
-        self.layout = QVBoxLayout(self)
-
-        # Add buttons to load and remove data
-        button_layout = QHBoxLayout()
-
-        self.loadButton = QPushButton("Projektdaten laden")
-        self.loadButton.clicked.connect(self.addData)
-        button_layout.addWidget(self.loadButton)
+@functools.lru_cache(maxsize=16)
+def _cached_json_load(path, mtime):
+    with open(path, 'r') as json_file:
+        return json.load(json_file)
 
-        self.removeButton = QPushButton("Projektdaten entfernen")
-        self.removeButton.clicked.connect(self.removeData)
-        button_layout.addWidget(self.removeButton)
+@functools.lru_cache(maxsize=16)
+def _cached_import_results_csv(path, mtime):
+    return import_results_csv(path)
 
-        self.layout.addLayout(button_layout)
+class VariantLoadThread(QThread):
+    """
+    Thread for loading the data of one variant and computing its key figures.
 
-        # Create a table widget to display the data
-        self.tableWidget = QTableWidget()
-        self.layout.addWidget(self.tableWidget)
+    Every variant gets its own thread instance, so several folders can be loaded in parallel
+    without sharing the intermediate network and profile attributes.
 
-        self.setLayout(self.layout)
+    Signals:
+        load_done (str, object): Emitted with the folder path and the results dictionary.
+        load_error (str, str): Emitted with the folder path and the error message including traceback.
+    """
+    load_done = pyqtSignal(str, object)
+    load_error = pyqtSignal(str, str)
 
-    def addData(self):
-        # Open a file dialog to select the base path for the data
-        folder_path = QFileDialog.getExistingDirectory(self, "Ordner auswählen", self.base_path)
+    def __init__(self, folder_path, config_manager):
+        """
+        Initializes the VariantLoadThread.
 
-        if folder_path:
-            self.folder_paths.append(folder_path)
-            data = self.load_variant_data(folder_path)
-            if data:
-                self.variant_data.append(data)
-                self.display_data_in_table()
+        Args:
+            folder_path (str): Folder of the variant to load.
+            config_manager: Config manager for the relative file paths.
+        """
+        super().__init__()
+        self.folder_path = folder_path
+        self.config_manager = config_manager
 
-    def removeData(self):
-        if self.variant_data:
-            self.variant_data.pop()
-            self.folder_paths.pop()
-            self.display_data_in_table()
-        else:
-            QMessageBox.warning(self, "Keine Daten", "Keine Daten zum entfernen vorhanden.")
+    def run(self):
+        """
+        Loads the variant and emits the results.
+        """
+        try:
+            results = self.load_variant_data(self.folder_path)
+            self.load_done.emit(self.folder_path, results)
+        except Exception as e:
+            self.load_error.emit(self.folder_path, f"{str(e)}\n\nTraceback:\n{traceback.format_exc()}")
 
     def load_variant_data(self, folder_path):
-        try:
-            # Load network data
-            self.loadNet(folder_path)
+        # Load network data
+        self.loadNet(folder_path)
 
-            if not hasattr(self, 'net'):
-                self.result_text = "Netzdaten nicht verfügbar."
-                self.results_display.setPlainText(self.result_text)
-                return
+        net = self.net
 
-            Anzahl_Gebäude = len(self.net.heat_consumer) if hasattr(self.net, 'heat_consumer') else None
+        heat_consumer = getattr(net, 'heat_consumer', None)
+        Anzahl_Gebäude = len(heat_consumer) if heat_consumer is not None else None
 
-            if hasattr(self.net, 'circ_pump_pressure'):
-                if hasattr(self.net, 'circ_pump_mass'):
-                    Anzahl_Heizzentralen = len(self.net.circ_pump_pressure) + len(self.net.circ_pump_mass)
-                else:
-                    Anzahl_Heizzentralen = len(self.net.circ_pump_pressure)
+        circ_pump_pressure = getattr(net, 'circ_pump_pressure', None)
+        if circ_pump_pressure is not None:
+            circ_pump_mass = getattr(net, 'circ_pump_mass', None)
+            if circ_pump_mass is not None:
+                Anzahl_Heizzentralen = len(circ_pump_pressure) + len(circ_pump_mass)
             else:
-                Anzahl_Heizzentralen = None
+                Anzahl_Heizzentralen = len(circ_pump_pressure)
+        else:
+            Anzahl_Heizzentralen = None
 
-            Gesamtwärmebedarf_Gebäude_MWh = np.sum(self.waerme_ges_kW) / 1000 if hasattr(self, 'waerme_ges_kW') else None
-            Gesamtheizlast_Gebäude_kW = np.max(self.waerme_ges_kW) if hasattr(self, 'waerme_ges_kW') else None
+        # waerme_ges_kW ist hier bereits das 1D-Summenprofil, Summe und Maximum also nur über 8760 Werte
+        waerme_ges_kW = getattr(self, 'waerme_ges_kW', None)
+        if waerme_ges_kW is not None:
+            Gesamtwärmebedarf_Gebäude_MWh = waerme_ges_kW.sum() * 1e-3
+            Gesamtheizlast_Gebäude_kW = waerme_ges_kW.max()
+        else:
+            Gesamtwärmebedarf_Gebäude_MWh = None
+            Gesamtheizlast_Gebäude_kW = None
 
-            if hasattr(self.net.pipe, 'length_km'):
-                Trassenlänge_m = self.net.pipe.length_km.sum() * 1000 / 2
-            else:
-                Trassenlänge_m = None
-
-            Wärmebedarfsdichte_MWh_a_m = Gesamtwärmebedarf_Gebäude_MWh / Trassenlänge_m if Gesamtwärmebedarf_Gebäude_MWh is not None and Trassenlänge_m is not None else None
-            Anschlussdichte_kW_m = Gesamtheizlast_Gebäude_kW / Trassenlänge_m if Gesamtheizlast_Gebäude_kW is not None and Trassenlänge_m is not None else None
-
-            Jahreswärmeerzeugung_MWh = 0
-            Pumpenstrombedarf_MWh = 0
-            if hasattr(self, 'pump_results'):
-                for pump_type, pumps in self.pump_results.items():
-                    for idx, pump_data in pumps.items():
-                        Jahreswärmeerzeugung_MWh += np.sum(pump_data['qext_kW']) / 1000
-                        Pumpenstrombedarf_MWh += np.sum((pump_data['mass_flow']/1000)*(pump_data['deltap']*100)) / 1000
-
-            Verteilverluste_kW = Jahreswärmeerzeugung_MWh - Gesamtwärmebedarf_Gebäude_MWh if Gesamtwärmebedarf_Gebäude_MWh is not None and Jahreswärmeerzeugung_MWh is not None and Jahreswärmeerzeugung_MWh != 0 else None
-            rel_Verteilverluste_percent = (Verteilverluste_kW / Jahreswärmeerzeugung_MWh) * 100 if Verteilverluste_kW is not None and Jahreswärmeerzeugung_MWh is not None and Jahreswärmeerzeugung_MWh != 0 else None
-            
-            # Process the data as needed
-            results = {
-                "Anzahl angeschlossene Gebäude": Anzahl_Gebäude,
-                "Anzahl Heizzentralen": Anzahl_Heizzentralen,
-                "Jahresgesamtwärmebedarf (MWh)": round(Gesamtwärmebedarf_Gebäude_MWh, 2),
-                "max. Heizlast Gebäude (kW)": round(Gesamtheizlast_Gebäude_kW, 2),
-                "Trassenlänge Wärmenetz (m)": round(Trassenlänge_m, 2),
-                "Wärmebedarfsdichte (MWh/(a*m))": round(Wärmebedarfsdichte_MWh_a_m, 2),
-                "Anschlussdichte (kW/m)": round(Anschlussdichte_kW_m, 2),
-                "Jahreswärmeerzeugung (MWh)": round(Jahreswärmeerzeugung_MWh, 2),
-                "Verteilverluste (kW)": round(Verteilverluste_kW, 2),
-                "Relative Verteilverluste (%)": round(rel_Verteilverluste_percent, 2),
-                "Pumpenstrombedarf (MWh)": round(Pumpenstrombedarf_MWh, 2)
-            }
-
-            return results
-        except Exception as e:
-            # Capture the traceback and display it in a message box
-            tb_str = traceback.format_exc()
-            QMessageBox.critical(self, "Loading Failed", f"Error loading data for {folder_path}:\n\n{str(e)}\n\nTraceback:\n{tb_str}")
-            raise e
+        pipe = net.pipe
+        if 'length_km' in pipe.columns:
+            # Vor- und Rücklauf: Trassenlänge = Rohrlänge * 1000 / 2
+            Trassenlänge_m = float(pipe['length_km'].to_numpy().sum()) * 500.0
+        else:
+            Trassenlänge_m = None
+
+        Wärmebedarfsdichte_MWh_a_m = Gesamtwärmebedarf_Gebäude_MWh / Trassenlänge_m if Gesamtwärmebedarf_Gebäude_MWh is not None and Trassenlänge_m is not None else None
+        Anschlussdichte_kW_m = Gesamtheizlast_Gebäude_kW / Trassenlänge_m if Gesamtheizlast_Gebäude_kW is not None and Trassenlänge_m is not None else None
+
+        Jahreswärmeerzeugung_MWh = 0.0
+        Pumpenstrombedarf_MWh = 0.0
+        pump_results = getattr(self, 'pump_results', None)
+        if pump_results is not None:
+            # Summen je Pumpe direkt auf Skalare aufaddieren, ohne die Profile aneinanderzuhängen
+            for pumps in pump_results.values():
+                for pump_data in pumps.values():
+                    Jahreswärmeerzeugung_MWh += pump_data['qext_kW'].sum()
+                    Pumpenstrombedarf_MWh += np.dot(pump_data['mass_flow'], pump_data['deltap'])
+            # kW -> MWh bzw. (mass_flow/1000)*(deltap*100)/1000 einmal am Ende
+            Jahreswärmeerzeugung_MWh *= 1e-3
+            Pumpenstrombedarf_MWh *= 1e-4
+
+        Verteilverluste_kW = Jahreswärmeerzeugung_MWh - Gesamtwärmebedarf_Gebäude_MWh if Gesamtwärmebedarf_Gebäude_MWh is not None and Jahreswärmeerzeugung_MWh is not None and Jahreswärmeerzeugung_MWh != 0 else None
+        rel_Verteilverluste_percent = (Verteilverluste_kW / Jahreswärmeerzeugung_MWh) * 100 if Verteilverluste_kW is not None and Jahreswärmeerzeugung_MWh is not None and Jahreswärmeerzeugung_MWh != 0 else None
+        
+        # Process the data as needed
+        results = {
+            "Anzahl angeschlossene Gebäude": Anzahl_Gebäude,
+            "Anzahl Heizzentralen": Anzahl_Heizzentralen,
+            "Jahresgesamtwärmebedarf (MWh)": round(Gesamtwärmebedarf_Gebäude_MWh, 2),
+            "max. Heizlast Gebäude (kW)": round(Gesamtheizlast_Gebäude_kW, 2),
+            "Trassenlänge Wärmenetz (m)": round(Trassenlänge_m, 2),
+            "Wärmebedarfsdichte (MWh/(a*m))": round(Wärmebedarfsdichte_MWh_a_m, 2),
+            "Anschlussdichte (kW/m)": round(Anschlussdichte_kW_m, 2),
+            "Jahreswärmeerzeugung (MWh)": round(Jahreswärmeerzeugung_MWh, 2),
+            "Verteilverluste (kW)": round(Verteilverluste_kW, 2),
+            "Relative Verteilverluste (%)": round(rel_Verteilverluste_percent, 2),
+            "Pumpenstrombedarf (MWh)": round(Pumpenstrombedarf_MWh, 2)
+        }
+
+        return results
 
     def loadNet(self, folder_path):
         """
         Loads the network from a file, similar to the provided example.
         """
-        try:
-            # Load different components
-            self.load_pickle_file(folder_path)
-            self.load_csv_file(folder_path)
-            self.load_json_file(folder_path)
-
-            # Process data
-            self.process_loaded_data()
-
-            # Load additional results
-            self.load_net_results(folder_path)
-
-            QMessageBox.information(self, "Laden erfolgreich", 
-                                    "Daten erfolgreich geladen aus: {}, {} und {}.".format(
-                                        os.path.join(folder_path, self.config_manager.get_relative_path("csv_net_init_file_path")),
-                                        os.path.join(folder_path, self.config_manager.get_relative_path("pp_pickle_file_path")),
-                                        os.path.join(folder_path, self.config_manager.get_relative_path("json_net_init_file_path"))
-                                    ))
-        except Exception as e:
-            QMessageBox.critical(self, "Laden fehlgeschlagen", "Fehler beim Laden der Daten: {}".format(e))
+        # Dateipfade einmal je Variante auflösen
+        get_path = self.config_manager.get_relative_path
+        pickle_file_path = os.path.join(folder_path, get_path("pp_pickle_file_path"))
+        csv_file_path = os.path.join(folder_path, get_path("csv_net_init_file_path"))
+        json_file_path = os.path.join(folder_path, get_path("json_net_init_file_path"))
+        results_csv_filepath = os.path.join(folder_path, get_path("load_profile_path"))
+
+        # Load different components
+        self.load_pickle_file(pickle_file_path)
+        self.load_csv_file(csv_file_path)
+        self.load_json_file(json_file_path)
+
+        # Process data
+        self.process_loaded_data()
+
+        # Load additional results
+        self.load_net_results(results_csv_filepath)
 
-    def load_pickle_file(self, folder_path):
+    def load_pickle_file(self, pickle_file_path):
         """
         Loads the network data from a pickle file.
         """
-        pickle_file_path = os.path.join(folder_path, self.config_manager.get_relative_path("pp_pickle_file_path"))
-        self.net = pp.from_pickle(pickle_file_path)
+        self.net = _cached_from_pickle(pickle_file_path, os.path.getmtime(pickle_file_path))
 
-    def load_csv_file(self, folder_path):
+    def load_csv_file(self, csv_file_path):
         """
         Loads the heat and electricity demand data from a CSV file.
         """
-        csv_file_path = os.path.join(folder_path, self.config_manager.get_relative_path("csv_net_init_file_path"))
-
-
-        with open(csv_file_path, newline='') as csvfile:
-            reader = csv.reader(csvfile, delimiter=';')
-            headers = next(reader)
-            num_waerme_cols = len([h for h in headers if h.startswith('waerme_ges_W')])
-            num_strom_cols = len([h for h in headers if h.startswith('strombedarf_hast_ges_W')])
-
-            formatted_time_steps = []
-            waerme_ges_W_data = []
-            strombedarf_hast_ges_W_data = []
-
-            for row in reader:
-                formatted_time_steps.append(np.datetime64(row[0]))
-                waerme_ges_W_data.append([float(value) for value in row[1:num_waerme_cols + 1]])
-                strombedarf_hast_ges_W_data.append([float(value) for value in row[num_waerme_cols + 1:num_waerme_cols + num_strom_cols + 1]])
-
-            self.yearly_time_steps = np.array(formatted_time_steps)
-            self.waerme_ges_W = np.array(waerme_ges_W_data).transpose()
-            self.strombedarf_hast_ges_W = np.array(strombedarf_hast_ges_W_data).transpose()
-
-    def load_json_file(self, folder_path):
+        # Parsing im C-Tokenizer von pandas statt zeilenweise mit dem csv-Modul,
+        # die Datei wird dabei direkt aus dem Speicherabbild gelesen
+        df = pd.read_csv(csv_file_path, sep=';', engine='c', memory_map=True)
+        waerme_cols = [c for c in df.columns if c.startswith('waerme_ges_W')]
+        strom_cols = [c for c in df.columns if c.startswith('strombedarf_hast_ges_W')]
+
+        self.yearly_time_steps = df.iloc[:, 0].to_numpy(dtype='datetime64[s]')
+        # to_numpy liefert (Zeitschritt, Gebäude) C-zusammenhängend, die Attribute sind
+        # transponierte Sichten darauf in der gewohnten Form (Gebäude, Zeitschritt)
+        self.waerme_ges_W = df[waerme_cols].to_numpy(dtype=np.float64).T
+        self.strombedarf_hast_ges_W = df[strom_cols].to_numpy(dtype=np.float64).T
+
+    def load_json_file(self, json_file_path):
         """
         Loads additional configuration data from a JSON file.
         """
-        json_file_path = os.path.join(folder_path, self.config_manager.get_relative_path("json_net_init_file_path"))
-
-        with open(json_file_path, 'r') as json_file:
-            additional_data = json.load(json_file)
+        additional_data = _cached_json_load(json_file_path, os.path.getmtime(json_file_path))
 
         self.supply_temperature = np.array(additional_data['supply_temperature'])
         self.supply_temperature_heat_consumer = float(additional_data['supply_temperature_heat_consumers'])
@@ -231,46 +218,122 @@ class StatComparisonTab(QWidget):
                         self.dT_RL, self.building_temp_checked, self.strombedarf_hast_ges_W,
                         self.max_el_leistung_hast_ges_W, self.TRY_filename, self.COP_filename)
         
-        self.waerme_ges_kW = np.where(self.waerme_ges_W == 0, 0, self.waerme_ges_W / 1000)
-        self.strombedarf_hast_ges_kW = np.where(self.strombedarf_hast_ges_W == 0, 0, self.strombedarf_hast_ges_W / 1000)
-        
-        self.waerme_ges_kW = np.sum(self.waerme_ges_kW, axis=0)
-        self.strombedarf_hast_ges_kW = np.sum(self.strombedarf_hast_ges_kW, axis=0)
+        # Erst summieren, dann umrechnen: keine 2D-Zwischenkopie in kW.
+        # Summiert wird über die zusammenhängenden Zeilen des (Zeitschritt, Gebäude)-Arrays.
+        self.waerme_ges_kW = self.waerme_ges_W.T.sum(axis=1, dtype=np.float64) * 1e-3
+        self.strombedarf_hast_ges_kW = self.strombedarf_hast_ges_W.T.sum(axis=1, dtype=np.float64) * 1e-3
 
-    def load_net_results(self, folder_path):
+    def load_net_results(self, results_csv_filepath):
         """
         Loads the network results from a file.
         """
-        results_csv_filepath = os.path.join(folder_path, self.config_manager.get_relative_path("load_profile_path"))
-        plot_data = import_results_csv(results_csv_filepath)
+        plot_data = _cached_import_results_csv(results_csv_filepath, os.path.getmtime(results_csv_filepath))
         self.time_steps, self.waerme_ges_kW, self.strom_wp_kW, self.pump_results = plot_data
 
-    def display_data_in_table(self):
-        # Clear the table first
-        self.tableWidget.clear()
+class StatComparisonTab(QWidget):
+    def __init__(self, folder_manager, config_manager, parent=None):
+        super().__init__(parent)
+        self.folder_manager = folder_manager
+        self.config_manager = config_manager
+        self.folder_paths = []
+        self.variant_data = []
+        self.load_threads = []
+
+        # Connect to the data manager signal
+        self.folder_manager.project_folder_changed.connect(self.updateDefaultPath)
+        self.updateDefaultPath(self.folder_manager.variant_folder)
+
+        self.initUI()
+
+    @pyqtSlot(str)
+    def updateDefaultPath(self, new_base_path):
+        self.base_path = new_base_path
+
+    def initUI(self):
+        self.layout = QVBoxLayout(self)
+
+        # Add buttons to load and remove data
+        button_layout = QHBoxLayout()
+
+        self.loadButton = QPushButton("Projektdaten laden")
+        self.loadButton.clicked.connect(self.addData)
+        button_layout.addWidget(self.loadButton)
 
+        self.removeButton = QPushButton("Projektdaten entfernen")
+        self.removeButton.clicked.connect(self.removeData)
+        button_layout.addWidget(self.removeButton)
+
+        self.layout.addLayout(button_layout)
+
+        # Create a table view to display the data, the model is rebuilt in display_data_in_table
+        self.tableView = QTableView()
+        self.tableView.setModel(QStandardItemModel(self))
+        self.layout.addWidget(self.tableView)
+
+        self.setLayout(self.layout)
+
+    @pyqtSlot()
+    def addData(self):
+        # Open a file dialog to select the base path for the data
+        folder_path = QFileDialog.getExistingDirectory(self, "Ordner auswählen", self.base_path,
+                                                       options=QFileDialog.ShowDirsOnly | FILE_DIALOG_OPTIONS)
+
+        if folder_path:
+            # Laden im Hintergrund, die GUI bleibt bedienbar
+            thread = VariantLoadThread(folder_path, self.config_manager)
+            thread.load_done.connect(self.onVariantLoaded)
+            thread.load_error.connect(self.onVariantLoadError)
+            thread.finished.connect(lambda: self.load_threads.remove(thread))
+            self.load_threads.append(thread)
+            thread.start()
+
+    @pyqtSlot(str, object)
+    def onVariantLoaded(self, folder_path, data):
+        # Pfad und Daten erst nach erfolgreichem Laden gemeinsam anhängen, damit die Spalten zusammenpassen
+        if data:
+            self.folder_paths.append(folder_path)
+            self.variant_data.append(data)
+            self.display_data_in_table()
+
+    @pyqtSlot(str, str)
+    def onVariantLoadError(self, folder_path, message):
+        QMessageBox.critical(self, "Laden fehlgeschlagen", f"Fehler beim Laden der Daten aus {folder_path}:\n\n{message}")
+
+    @pyqtSlot()
+    def removeData(self):
+        if self.variant_data:
+            self.variant_data.pop()
+            self.folder_paths.pop()
+            self.display_data_in_table()
+        else:
+            QMessageBox.warning(self, "Keine Daten", "Keine Daten zum entfernen vorhanden.")
+
+    def display_data_in_table(self):
         # Define the headers
         # split the base path to only show the last folder name
         self.folder_names = [os.path.basename(folder_path) for folder_path in self.folder_paths]
         headers = ["Metric"] + [f"{folder_name}" for folder_name in self.folder_names]
 
-        self.tableWidget.setColumnCount(len(headers))
-        self.tableWidget.setHorizontalHeaderLabels(headers)
-
         # Collect the ordered metrics based on the first dictionary (assuming all dictionaries have the same structure)
-        if self.variant_data:
-            ordered_metrics = list(self.variant_data[0].keys())
-
-            # Set the number of rows
-            self.tableWidget.setRowCount(len(ordered_metrics))
-
-            # Populate the table
-            for row, metric in enumerate(ordered_metrics):
-                self.tableWidget.setItem(row, 0, QTableWidgetItem(metric))
-                for col, data in enumerate(self.variant_data):
-                    value = data.get(metric, "N/A")
-                    if isinstance(value, (float, int)):
-                        value = f"{value:.2f}"  # Round the numbers to 2 decimal places
-                    self.tableWidget.setItem(row, col + 1, QTableWidgetItem(str(value)))
-
-            self.tableWidget.resizeColumnsToContents()
\ No newline at end of file
+        ordered_metrics = list(self.variant_data[0].keys()) if self.variant_data else []
+
+        # Das Modell wird ohne angeschlossene View befüllt und dann in einem Schritt gesetzt,
+        # so löst nicht jede Zelle ein eigenes Update der Tabelle aus
+        model = QStandardItemModel(len(ordered_metrics), len(headers), self)
+        model.setHorizontalHeaderLabels(headers)
+
+        # Populate the table
+        for row, metric in enumerate(ordered_metrics):
+            model.setItem(row, 0, QStandardItem(metric))
+            for col, data in enumerate(self.variant_data):
+                value = data.get(metric, "N/A")
+                # Round the numbers to 2 decimal places
+                text = f"{value:.2f}" if isinstance(value, (float, int)) else str(value)
+                model.setItem(row, col + 1, QStandardItem(text))
+
+        old_model = self.tableView.model()
+        self.tableView.setModel(model)
+        old_model.deleteLater()
+
+        if ordered_metrics:
+            self.tableView.resizeColumnsToContents()
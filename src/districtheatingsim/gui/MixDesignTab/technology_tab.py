@@ -6,22 +6,54 @@ Description: Contains the TechnologyTab.
 """
 
 import os
+from collections import Counter
 
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QPushButton, QLabel, QHBoxLayout, QLineEdit, 
-    QListWidget, QDialog, QFileDialog, QScrollArea, QAbstractItemView,
+    QListWidget, QListWidgetItem, QDialog, QFileDialog, QScrollArea, QAbstractItemView,
     QSplitter
 )
-from PyQt5.QtCore import pyqtSignal
+from PyQt5.QtCore import Qt, QTimer, pyqtSignal
+import numpy as np
 import pandas as pd
 from matplotlib.figure import Figure
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 
-from districtheatingsim.heat_generators.heat_generation_mix import *
 from districtheatingsim.gui.MixDesignTab.heat_generator_dialogs import TechInputDialog
 
 from districtheatingsim.gui.MixDesignTab.generator_schematic import SchematicScene, CustomGraphicsView
 
+# Zuordnung Technologietyp -> Klasse, wird beim ersten Zugriff einmalig befüllt
+_TECH_CLASSES = None
+
+def get_tech_classes():
+    """
+    Returns the mapping of technology types to their classes, importing the heat generators on first use.
+
+    Returns:
+        dict: The technology classes by type.
+    """
+    global _TECH_CLASSES
+    if _TECH_CLASSES is None:
+        # Erst bei Bedarf importieren, heat_generation_mix zieht scipy und alle Erzeugermodelle nach
+        from districtheatingsim.heat_generators.heat_generation_mix import (
+            SolarThermal, CHP, Geothermal, WasteHeatPump, RiverHeatPump, AqvaHeat, BiomassBoiler, GasBoiler, PowerToHeat
+        )
+
+        _TECH_CLASSES = {
+            "Solarthermie": SolarThermal,
+            "BHKW": CHP,
+            "Holzgas-BHKW": CHP,
+            "Geothermie": Geothermal,
+            "Abwärme": WasteHeatPump,
+            "Flusswasser": RiverHeatPump,
+            "AqvaHeat": AqvaHeat,
+            "Biomassekessel": BiomassBoiler,
+            "Gaskessel": GasBoiler,
+            "Power-to-Heat": PowerToHeat
+        }
+    return _TECH_CLASSES
+
 class CustomListWidget(QListWidget):
     """
     A custom QListWidget with additional functionality for handling drop events
@@ -67,6 +99,10 @@ class TechnologyTab(QWidget):
 
     data_added = pyqtSignal(object)  # Signal, das Daten als Objekt überträgt
 
+    # Höchstzahl der Punkte im Lastgang-Plot, längere Reihen werden per Min/Max-Dezimierung reduziert
+    # (bei breiten Plots wird die Grenze auf die doppelte Pixelbreite angehoben, None = volle Auflösung)
+    max_plot_points = 2000
+
     def __init__(self, data_manager, config_manager, parent=None):
         """
         Initializes the TechnologyTab.
@@ -80,6 +116,14 @@ class TechnologyTab(QWidget):
         self.config_manager = config_manager
         self.results = {}
         self.tech_objects = []
+        self.loadProfileCache = None  # ((Dateiname, Änderungszeit), eingelesener Lastgang)
+
+        # Verzögertes Neuladen, damit beim Tippen nicht jede Eingabe die CSV-Datei neu einliest
+        self.loadTimer = QTimer(self)
+        self.loadTimer.setSingleShot(True)
+        self.loadTimer.setInterval(300)
+        self.loadTimer.timeout.connect(self.loadFileAndPlot)
+
         self.initFileInputs()
         self.initUI()
 
@@ -136,7 +180,7 @@ class TechnologyTab(QWidget):
         layout.addWidget(self.selectFileButton)
         layout.addWidget(self.FilenameInput)
         self.mainLayout.addLayout(layout)
-        self.FilenameInput.textChanged.connect(self.loadFileAndPlot)
+        self.FilenameInput.textChanged.connect(self.loadTimer.start)
 
     def addLabel(self, text):
         """
@@ -163,7 +207,7 @@ class TechnologyTab(QWidget):
         self.load_scale_factorLabel = QLabel('Lastgang skalieren?:')
         self.load_scale_factorInput = QLineEdit("1")
         self.addHorizontalLayout(self.load_scale_factorLabel, self.load_scale_factorInput)
-        self.load_scale_factorInput.textChanged.connect(self.loadFileAndPlot)
+        self.load_scale_factorInput.textChanged.connect(self.loadTimer.start)
 
     def addHorizontalLayout(self, *widgets):
         """
@@ -212,21 +256,8 @@ class TechnologyTab(QWidget):
         Returns:
             Technology: The created technology object.
         """
-        tech_classes = {
-            "Solarthermie": SolarThermal,
-            "BHKW": CHP,
-            "Holzgas-BHKW": CHP,
-            "Geothermie": Geothermal,
-            "Abwärme": WasteHeatPump,
-            "Flusswasser": RiverHeatPump,
-            "AqvaHeat": AqvaHeat,
-            "Biomassekessel": BiomassBoiler,
-            "Gaskessel": GasBoiler,
-            "Power-to-Heat": PowerToHeat
-        }
-
         base_tech_type = tech_type.split('_')[0]
-        tech_class = tech_classes.get(base_tech_type)
+        tech_class = get_tech_classes().get(base_tech_type)
         if not tech_class:
             raise ValueError(f"Unbekannter Technologietyp: {tech_type}")
 
@@ -275,9 +306,8 @@ class TechnologyTab(QWidget):
             updated_tech.has_storage = updated_inputs.get('speicher_aktiv', False)  # Aktualisiere die Speicheroption
             self.tech_objects[selected_tech_index] = updated_tech
 
-            # Lösche die gesamte Szene und erstelle neu
+            # Lösche die gesamte Szene und erstelle neu, rebuildScene aktualisiert auch die Liste
             self.rebuildScene()
-            self.updateTechList()
 
     def removeSelectedTech(self):
         """
@@ -294,13 +324,10 @@ class TechnologyTab(QWidget):
             self.techList.takeItem(selected_row)
             del self.tech_objects[selected_row]
 
-            # Aktualisiere die globalen Zähler und füge alle verbleibenden Objekte wieder hinzu
+            # Aktualisiere die globalen Zähler und füge alle verbleibenden Objekte wieder hinzu, rebuildScene aktualisiert auch die Liste
             self.updateTechNames(tech_type)
             self.rebuildScene()
 
-            # Aktualisiere die Anzeige der Technologien
-            self.updateTechList()
-
     def rebuildScene(self):
         """
         Baut die gesamte Szene neu auf, indem alle verbleibenden Technologien hinzugefügt werden.
@@ -311,9 +338,8 @@ class TechnologyTab(QWidget):
             # Füge jede Technologie wieder zur Szene hinzu
             self.addTechToScene(tech)
 
-            # Aktualisiere die Namen und Zähler basierend auf der Reihenfolge in der Liste
-            tech_type = tech.name.split('_')[0]
-            self.global_counters[tech_type] = sum(1 for t in self.tech_objects if t.name.startswith(tech_type))
+        # Aktualisiere die Zähler basierend auf den verbleibenden Objekten, einmal pro Technologieklasse
+        self.global_counters.update(Counter(tech.name.split('_')[0] for tech in self.tech_objects))
 
         # Aktualisiere die Liste der Technologien in der UI
         self.updateTechList()
@@ -352,21 +378,16 @@ class TechnologyTab(QWidget):
         Updates the technology list display.
         """
         self.techList.clear()
-        for tech in self.tech_objects:
-            self.techList.addItem(self.formatTechForDisplay(tech))
+        for index, tech in enumerate(self.tech_objects):
+            item = QListWidgetItem(self.formatTechForDisplay(tech))
+            item.setData(Qt.UserRole, index)  # Position in tech_objects, bleibt beim Verschieben am Eintrag
+            self.techList.addItem(item)
 
     def updateTechObjectsOrder(self):
         """
         Updates the order of technology objects based on the list display.
         """
-        new_order = []
-        for index in range(self.techList.count()):
-            item_text = self.techList.item(index).text()
-            for tech in self.tech_objects:
-                if self.formatTechForDisplay(tech) == item_text:
-                    new_order.append(tech)
-                    break
-        self.tech_objects = new_order
+        self.tech_objects = [self.tech_objects[self.techList.item(index).data(Qt.UserRole)] for index in range(self.techList.count())]
 
         self.rebuildScene()
     
@@ -408,8 +429,9 @@ class TechnologyTab(QWidget):
         self.plotLayout = QVBoxLayout()  # Füge das Plot-Layout hinzu
         self.plotWidget = QWidget()
         self.plotWidget.setLayout(self.plotLayout)
-        self.plotFigure = Figure(figsize=(4, 3))
+        self.plotFigure = Figure(figsize=(6, 6))
         self.plotCanvas = FigureCanvas(self.plotFigure)
+        self.plotCanvas.setMinimumSize(500, 500)
         self.plotLayout.addWidget(self.plotCanvas)
         splitter.addWidget(self.plotWidget)
 
@@ -423,27 +445,29 @@ class TechnologyTab(QWidget):
 
     def createPlotCanvas(self):
         """
-        Creates the plot canvas for displaying graphs.
+        Clears the plot canvas for displaying graphs. The figure and canvas are created once in setupPlotAndSchematic and reused.
         """
-        if self.plotCanvas:
-            self.plotLayout.removeWidget(self.plotCanvas)
-            self.plotCanvas.deleteLater()
-
-        self.plotFigure = Figure(figsize=(6, 6))
-        self.plotCanvas = FigureCanvas(self.plotFigure)
-        self.plotCanvas.setMinimumSize(500, 500)
-        self.plotLayout.addWidget(self.plotCanvas)
+        self.plotFigure.clear()
 
     def loadFileAndPlot(self):
         """
         Loads the file and plots the data. If the file is not available or has issues,
         it displays a message on the plot canvas instead of throwing an error.
         """
+        self.loadTimer.stop()  # Ausstehendes verzögertes Neuladen ist damit erledigt
         filename = self.FilenameInput.text()
         if filename:
             try:
-                data = pd.read_csv(filename, sep=";")
-                self.plotData(data)
+                cache_key = (filename, os.path.getmtime(filename))
+                if self.loadProfileCache is None or self.loadProfileCache[0] != cache_key:
+                    # Nur die geplotteten Spalten einlesen, fehlende Spalten meldet plotData
+                    plot_columns = ('Zeit', 'Wärmeerzeugung_Heizentrale Haupteinspeisung_1_kW')
+                    data = pd.read_csv(filename, sep=";", usecols=lambda column: column in plot_columns,
+                                       dtype={'Wärmeerzeugung_Heizentrale Haupteinspeisung_1_kW': np.float32})
+                    if 'Zeit' in data.columns:
+                        data['Zeit'] = pd.to_datetime(data['Zeit'])  # Zeitachse nur einmal pro Datei parsen
+                    self.loadProfileCache = (cache_key, data)
+                self.plotData(self.loadProfileCache[1])
             except FileNotFoundError:
                 self.showInfoMessageOnPlot("Datei nicht gefunden. Bitte wählen Sie eine gültige CSV-Datei aus.")
             except pd.errors.EmptyDataError:
@@ -469,15 +493,41 @@ class TechnologyTab(QWidget):
         self.createPlotCanvas()
         ax = self.plotFigure.add_subplot(111)
         if 'Zeit' in data.columns and 'Wärmeerzeugung_Heizentrale Haupteinspeisung_1_kW' in data.columns:
-            ax.plot(pd.to_datetime(data['Zeit']), data['Wärmeerzeugung_Heizentrale Haupteinspeisung_1_kW'] * scale_factor, label='Gesamtwärmebedarf')
+            times = data['Zeit'].to_numpy()
+            values = data['Wärmeerzeugung_Heizentrale Haupteinspeisung_1_kW'].to_numpy() * scale_factor
+            if self.max_plot_points is not None:
+                times, values = self.downsampleMinMax(times, values, max(self.max_plot_points, 2 * self.plotCanvas.width()))
+            ax.plot(times, values, label='Gesamtwärmebedarf')
             ax.set_title("Jahresgang Wärmebedarf")
             ax.set_xlabel("Zeit")
             ax.set_ylabel("Wärmebedarf (kW)")
             ax.legend()
-            self.plotCanvas.draw()
+            self.plotCanvas.draw_idle()
         else:
             self.showErrorMessage("Die Datei enthält nicht die erforderlichen Spalten 'Zeit' und 'Wärmeerzeugung_Heizentrale Haupteinspeisung_1_kW'.")
 
+    @staticmethod
+    def downsampleMinMax(times, values, max_points):
+        """
+        Reduces a time series to at most max_points by keeping the minimum and maximum of each bin,
+        so peaks stay visible while far fewer vertices are drawn.
+
+        Args:
+            times (ndarray): The time axis.
+            values (ndarray): The values.
+            max_points (int): The maximum number of points to return.
+
+        Returns:
+            tuple: The reduced time axis and values.
+        """
+        if len(values) <= max_points:
+            return times, values
+
+        bin_size = -(-len(values) // (max_points // 2))  # Aufrunden
+        bin_starts = np.arange(0, len(values), bin_size)
+        reduced_values = np.column_stack((np.minimum.reduceat(values, bin_starts), np.maximum.reduceat(values, bin_starts))).ravel()
+        return np.repeat(times[bin_starts], 2), reduced_values
+
     def showInfoMessageOnPlot(self, message):
         """
         Displays an information message on the plot canvas.
@@ -489,7 +539,7 @@ class TechnologyTab(QWidget):
         ax = self.plotFigure.add_subplot(111)
         ax.text(0.5, 0.5, message, ha='center', va='center', transform=ax.transAxes)
         ax.set_axis_off()
-        self.plotCanvas.draw()
+        self.plotCanvas.draw_idle()
 
     def addTechToScene(self, tech):
         """
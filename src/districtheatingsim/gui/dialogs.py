@@ -8,8 +8,16 @@ Description: Contains the Dialogs of the main GUI
 import sys
 import os
 
+from PyQt5.QtCore import pyqtSlot
 from PyQt5.QtWidgets import QVBoxLayout, QLineEdit, QLabel, QDialog, QPushButton, QHBoxLayout, QFileDialog, QCheckBox, QDialogButtonBox
 
+if getattr(sys, 'frozen', False):
+    # When the application is frozen, the base path is the temp folder where PyInstaller extracts everything
+    _BASE_PATH = sys._MEIPASS
+else:
+    # When the application is not frozen, the base path is the folder where the main file is located
+    _BASE_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
 def get_resource_path(relative_path):
     """
     Get the absolute path to the resource, works for dev and for PyInstaller.
@@ -20,14 +28,36 @@ def get_resource_path(relative_path):
     Returns:
         str: The absolute path to the resource.
     """
-    if getattr(sys, 'frozen', False):
-        # When the application is frozen, the base path is the temp folder where PyInstaller extracts everything
-        base_path = sys._MEIPASS
-    else:
-        # When the application is not frozen, the base path is the folder where the main file is located
-        base_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    return os.path.join(_BASE_PATH, relative_path)
+
+# Default files of the dialogs, resolved once at import time
+DEFAULT_TRY_FILE = get_resource_path("data/TRY/TRY_511676144222/TRY2015_511676144222_Jahr.dat")
+DEFAULT_COP_FILE = get_resource_path("data/COP/Kennlinien WP.csv")
+
+# Skip the per-entry icon provider and symlink resolution, which are slow on network drives
+FILE_DIALOG_OPTIONS = QFileDialog.DontUseCustomDirectoryIcons | QFileDialog.DontResolveSymlinks
+
+def create_button_layout(dialog):
+    """
+    Creates the OK/Abbrechen button row connected to accept and reject of the dialog.
+
+    Args:
+        dialog (QDialog): The dialog the buttons belong to.
+
+    Returns:
+        QHBoxLayout: The layout with both buttons.
+    """
+    buttonLayout = QHBoxLayout()
+    okButton = QPushButton("OK", dialog)
+    cancelButton = QPushButton("Abbrechen", dialog)
 
-    return os.path.join(base_path, relative_path)
+    okButton.clicked.connect(dialog.accept)
+    cancelButton.clicked.connect(dialog.reject)
+
+    buttonLayout.addWidget(okButton)
+    buttonLayout.addWidget(cancelButton)
+
+    return buttonLayout
 
 class TemperatureDataDialog(QDialog):
     """
@@ -58,27 +88,20 @@ class TemperatureDataDialog(QDialog):
 
         self.temperatureDataFileLabel = QLabel("TRY-Datei:", self)
         self.temperatureDataFileInput = QLineEdit(self)
-        self.temperatureDataFileInput.setText(get_resource_path("data/TRY/TRY_511676144222/TRY2015_511676144222_Jahr.dat"))
+        self.temperatureDataFileInput.setText(DEFAULT_TRY_FILE)
         self.selectTRYFileButton = QPushButton('TRY-Datei auswählen')
-        self.selectTRYFileButton.clicked.connect(lambda: self.selectFilename(self.temperatureDataFileInput))
+        self.selectTRYFileButton.clicked.connect(self.selectTRYFile)
 
         self.layout.addWidget(self.temperatureDataFileLabel)
         self.layout.addWidget(self.temperatureDataFileInput)
         self.layout.addWidget(self.selectTRYFileButton)
 
-        self.setLayout(self.layout)
-
-        buttonLayout = QHBoxLayout()
-        okButton = QPushButton("OK", self)
-        cancelButton = QPushButton("Abbrechen", self)
-        
-        okButton.clicked.connect(self.accept)
-        cancelButton.clicked.connect(self.reject)
-        
-        buttonLayout.addWidget(okButton)
-        buttonLayout.addWidget(cancelButton)
+        self.layout.addLayout(create_button_layout(self))
 
-        self.layout.addLayout(buttonLayout)
+    @pyqtSlot()
+    def selectTRYFile(self):
+        """Opens a file dialog to select the TRY file."""
+        self.selectFilename(self.temperatureDataFileInput)
 
     def selectFilename(self, lineEdit):
         """
@@ -87,7 +110,7 @@ class TemperatureDataDialog(QDialog):
         Args:
             lineEdit (QLineEdit): The QLineEdit to set the file path.
         """
-        filename, _ = QFileDialog.getOpenFileName(self, "Datei auswählen")
+        filename, _ = QFileDialog.getOpenFileName(self, "Datei auswählen", options=FILE_DIALOG_OPTIONS)
         if filename:
             lineEdit.setText(filename)
 
@@ -120,7 +143,6 @@ class HeatPumpDataDialog(QDialog):
             parent: The parent widget.
         """
         super().__init__(parent)
-        self.setWindowTitle("Wärmepumpendaten")
         self.initUI()
 
     def initUI(self):
@@ -135,9 +157,9 @@ class HeatPumpDataDialog(QDialog):
         dataLayout = QVBoxLayout()
         self.heatPumpDataFileLabel = QLabel("csv-Datei mit Wärmepumpenkennfeld:")
         self.heatPumpDataFileInput = QLineEdit()
-        self.heatPumpDataFileInput.setText(get_resource_path("data/COP/Kennlinien WP.csv"))
+        self.heatPumpDataFileInput.setText(DEFAULT_COP_FILE)
         self.selectCOPFileButton = QPushButton('csv-Datei auswählen')
-        self.selectCOPFileButton.clicked.connect(lambda: self.selectFilename(self.heatPumpDataFileInput))
+        self.selectCOPFileButton.clicked.connect(self.selectCOPFile)
         
         dataLayout.addWidget(self.heatPumpDataFileLabel)
         dataLayout.addWidget(self.heatPumpDataFileInput)
@@ -146,18 +168,12 @@ class HeatPumpDataDialog(QDialog):
         mainLayout.addLayout(dataLayout)
 
         # Button layout for OK and Cancel
-        buttonLayout = QHBoxLayout()
-        okButton = QPushButton("OK")
-        cancelButton = QPushButton("Abbrechen")
+        mainLayout.addLayout(create_button_layout(self))
 
-        okButton.clicked.connect(self.accept)
-        cancelButton.clicked.connect(self.reject)
-
-        buttonLayout.addWidget(okButton)
-        buttonLayout.addWidget(cancelButton)
-
-        mainLayout.addLayout(buttonLayout)
-        self.setLayout(mainLayout)
+    @pyqtSlot()
+    def selectCOPFile(self):
+        """Opens a file dialog to select the COP data file."""
+        self.selectFilename(self.heatPumpDataFileInput)
 
     def selectFilename(self, lineEdit):
         """
@@ -166,7 +182,7 @@ class HeatPumpDataDialog(QDialog):
         Args:
             lineEdit (QLineEdit): The QLineEdit to set the file path.
         """
-        filename, _ = QFileDialog.getOpenFileName(self, "Datei auswählen", "", "CSV-Dateien (*.csv)")
+        filename, _ = QFileDialog.getOpenFileName(self, "Datei auswählen", "", "CSV-Dateien (*.csv)", options=FILE_DIALOG_OPTIONS)
         if filename:
             lineEdit.setText(filename)
 
@@ -182,6 +198,19 @@ class HeatPumpDataDialog(QDialog):
         }
 
 class PDFSelectionDialog(QDialog):
+    # Abschnitte des PDF-Berichts: (Schlüssel, Beschriftung der Checkbox)
+    sections = (
+        ('net_structure', "Netzstruktur"),
+        ('economic_conditions', "Wirtschaftliche Randbedingungen"),
+        ('technologies', "Erzeugertechnologien"),
+        ('technologies_scene', "Schaltbild Erzeugertechnologien"),
+        ('costs_net_infrastructure', "Kosten Netzinfrastruktur"),
+        ('costs_heat_generators', "Kosten Wärmeerzeuger"),
+        ('costs_total', "Gesamtkosten"),
+        ('results', "Berechnungsergebnisse"),
+        ('combined_results', "Wirtschaftlichkeit"),
+    )
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setWindowTitle("PDF Abschnittsauswahl")
@@ -190,35 +219,12 @@ class PDFSelectionDialog(QDialog):
         layout = QVBoxLayout()
 
         # Checkboxen für die verschiedenen Abschnitte
-        self.net_structure_cb = QCheckBox("Netzstruktur")
-        self.net_structure_cb.setChecked(True)
-        self.economic_conditions_cb = QCheckBox("Wirtschaftliche Randbedingungen")
-        self.economic_conditions_cb.setChecked(True)
-        self.technologies_cb = QCheckBox("Erzeugertechnologien")
-        self.technologies_cb.setChecked(True)
-        self.technolgies_scene_cb = QCheckBox("Schaltbild Erzeugertechnologien")
-        self.technolgies_scene_cb.setChecked(True)
-        self.costs_net_infrastructure_cb = QCheckBox("Kosten Netzinfrastruktur")
-        self.costs_net_infrastructure_cb.setChecked(True)
-        self.costs_heat_generators_cb = QCheckBox("Kosten Wärmeerzeuger")
-        self.costs_heat_generators_cb.setChecked(True)
-        self.costs_total_cb = QCheckBox("Gesamtkosten")
-        self.costs_total_cb.setChecked(True)
-        self.results_cb = QCheckBox("Berechnungsergebnisse")
-        self.results_cb.setChecked(True)
-        self.combined_results_cb = QCheckBox("Wirtschaftlichkeit")
-        self.combined_results_cb.setChecked(True)
-
-        # Checkboxen zum Layout hinzufügen
-        layout.addWidget(self.net_structure_cb)
-        layout.addWidget(self.economic_conditions_cb)
-        layout.addWidget(self.technologies_cb)
-        layout.addWidget(self.technolgies_scene_cb)
-        layout.addWidget(self.costs_net_infrastructure_cb)
-        layout.addWidget(self.costs_heat_generators_cb)
-        layout.addWidget(self.costs_total_cb)
-        layout.addWidget(self.results_cb)
-        layout.addWidget(self.combined_results_cb)
+        self.section_checkboxes = {}
+        for key, label in self.sections:
+            checkbox = QCheckBox(label)
+            checkbox.setChecked(True)
+            layout.addWidget(checkbox)
+            self.section_checkboxes[key] = checkbox
 
         # Dialogbuttons (OK/Cancel)
         buttonBox = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
@@ -232,14 +238,4 @@ class PDFSelectionDialog(QDialog):
         """
         Gibt die vom Benutzer ausgewählten Abschnitte zurück.
         """
-        return {
-            'net_structure': self.net_structure_cb.isChecked(),
-            'economic_conditions': self.economic_conditions_cb.isChecked(),
-            'technologies': self.technologies_cb.isChecked(),
-            'technologies_scene': self.technolgies_scene_cb.isChecked(),
-            'costs_net_infrastructure': self.costs_net_infrastructure_cb.isChecked(),
-            'costs_heat_generators': self.costs_heat_generators_cb.isChecked(),
-            'costs_total': self.costs_total_cb.isChecked(),
-            'results': self.results_cb.isChecked(),
-            'combined_results': self.combined_results_cb.isChecked()
-        }
+        return {key: checkbox.isChecked() for key, checkbox in self.section_checkboxes.items()}